@@ -35,6 +35,7 @@ class ExportHandle:
     """Callable handle that references a widget output."""
 
     __vibe_export__ = True
+    __slots__ = ("widget", "name")
 
     def __init__(self, widget: Any, name: str):
         self.widget = widget
@@ -2,12 +2,17 @@
 Core VibeWidget implementation.
 Clean, robust widget generation without legacy profile logic.
 """
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Union
+import functools
 import json
 import warnings
 import inspect
+import re
 import sys
+import threading
+import time
 
 import anywidget
 import pandas as pd
@@ -42,9 +47,160 @@ from vibe_widget.utils.audit_store import (
     strip_internal_fields,
     normalize_location,
 )
-from vibe_widget.utils.util import clean_for_json, initial_import_value, load_data
+from vibe_widget.utils.util import (
+    clean_for_json,
+    dataframe_to_records,
+    dumps_json,
+    loads_json,
+    initial_import_value,
+    load_data,
+    read_json_file,
+    records_to_dataframe,
+)
 from vibe_widget.themes import Theme, resolve_theme_for_request, clear_theme_cache
 
+_WIDGET_STORE: WidgetStore | None = None
+# Serializes widget store reads and writes between the kernel and edit worker threads
+_STORE_LOCK = threading.RLock()
+
+
+def _get_widget_store() -> WidgetStore:
+    """Return the shared widget store for the current working directory."""
+    global _WIDGET_STORE
+    if _WIDGET_STORE is None or _WIDGET_STORE.store_dir != Path.cwd() / ".vibewidget":
+        _WIDGET_STORE = WidgetStore()
+    else:
+        _WIDGET_STORE.refresh_index()
+    return _WIDGET_STORE
+
+
+def _reset_widget_store() -> None:
+    """Drop the shared widget store and any sources resolved through it."""
+    global _WIDGET_STORE
+    _WIDGET_STORE = None
+    _resolve_source_by_path.cache_clear()
+
+
+_AUDIT_STORE: AuditStore | None = None
+
+
+def _get_audit_store() -> AuditStore:
+    """Return the shared audit store for the current working directory."""
+    global _AUDIT_STORE
+    if _AUDIT_STORE is None or _AUDIT_STORE.store_dir != Path.cwd() / ".vibewidget":
+        _AUDIT_STORE = AuditStore()
+    else:
+        _AUDIT_STORE.refresh_index()
+    return _AUDIT_STORE
+
+
+# Widget attributes that always resolve normally, even if an export shares the name
+_RESERVED_WIDGET_ATTRS = frozenset({"outputs", "component"})
+_SERIALIZER_FUNCTIONS = frozenset({"get_state", "_trait_to_json", "_should_send_property"})
+
+
+def _called_from_serializer() -> bool:
+    """Check the three frames above the attribute access for traitlets serialization."""
+    try:
+        frame = sys._getframe(2)
+    except ValueError:  # call stack shallower than the attribute access
+        return False
+    for _ in range(3):
+        if frame is None:
+            break
+        code = frame.f_code
+        if code.co_name in _SERIALIZER_FUNCTIONS or "traitlets" in code.co_filename:
+            return True
+        frame = frame.f_back
+    return False
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+# (change field, prompt label) for audit-apply requests, in prompt order
+_AUDIT_APPLY_FIELDS = (
+    ("alternative", "alternative"),
+    ("user_note", "user_note"),
+    ("details", "details"),
+    ("technical_summary", "technical"),
+)
+
+# Audit report schema used by VibeWidget._normalize_audit_report
+_AUDIT_IMPACT_LEVELS = frozenset({"high", "medium", "low"})
+_AUDIT_CHECK_STATUSES = frozenset({"yes", "no", "unknown"})
+_AUDIT_RISK_LEVELS = frozenset({"low", "medium", "high", "unknown"})
+_AUDIT_CONCERN_TEXT_FIELDS = ("summary", "details", "technical_summary")
+_AUDIT_ALTERNATIVE_FIELDS = ("option", "when_better", "when_worse")
+_AUDIT_LENS_TEXT_FIELDS = (
+    "uncertainty",
+    "reproducibility",
+    "edge_behavior",
+    "default_vs_explicit",
+    "appropriateness",
+    "safety",
+)
+_AUDIT_SAFETY_CHECKS = (
+    "external_network_usage",
+    "dynamic_code_execution",
+    "storage_writes",
+    "cross_origin_fetch",
+    "iframe_script_injection",
+)
+
+
+def _clean_text_items(items: list[Any]) -> list[str]:
+    """Stringify and strip items, dropping empty ones."""
+    cleaned = []
+    for item in items:
+        text = str(item).strip()
+        if text:
+            cleaned.append(text)
+    return cleaned
+
+
+# PascalCase -> snake_case boundaries for component attribute names
+_CAMEL_WORD_RE = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY_RE = re.compile(r"([a-z0-9])([A-Z])")
+
+# Appended to grab-edit requests when the target is one of many data-joined siblings
+_DATA_BOUND_HINT = """
+
+IMPORTANT: This element is likely DATA-BOUND (one of {sibling_count} sibling <{tag}> elements).
+This typically means it was created by D3's .selectAll().data().join() pattern or similar.
+To modify this element, find and modify the D3 selection code that creates these elements,
+not a single static element in the template."""
+
+# Streaming log lines are synced once this many are buffered or the interval passes
+_LOG_FLUSH_LINES = 16
+_LOG_FLUSH_INTERVAL = 0.1
+
+# Handlers that block on an LLM call; they run on a per-widget worker thread
+_BACKGROUND_HANDLERS = frozenset({"_on_error", "_on_grab_edit", "_on_audit_apply_request"})
+
+
+def _report_background_error(future: Future) -> None:
+    """Print errors a background edit handler raised instead of losing them in its future."""
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        print(f"[vibe_widget] Background edit failed: {exc}", file=sys.stderr)
+
+
+# (base class, export names, import names) -> DynamicVibeWidget subclass
+_DYNAMIC_CLASS_CACHE: dict[tuple[type, tuple[str, ...], tuple[str, ...]], type] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_app_wrapper() -> str:
+    """Read the frontend bundle once per process."""
+    app_wrapper_dir = Path(__file__).parent
+    app_wrapper_path = app_wrapper_dir / "AppWrapper.bundle.js"
+    if not app_wrapper_path.exists():
+        # Fallback for older builds
+        app_wrapper_path = app_wrapper_dir / "app_wrapper.js"
+    return app_wrapper_path.read_text()
+
 
 def _export_to_json_value(value: Any, widget: Any) -> Any:
     """Trait serialization helper to unwrap export handles."""
@@ -68,7 +224,9 @@ def _import_to_json_value(value: Any, widget: Any) -> Any:
 
 class ComponentReference:
     """Reference to a component within a widget for composition."""
-    
+
+    __slots__ = ("widget", "component_name")
+
     def __init__(self, widget: "VibeWidget", component_name: str):
         self.widget = widget
         self.component_name = component_name
@@ -92,11 +250,15 @@ class _ComponentNamespace:
 
     def __init__(self, widget: "VibeWidget"):
         self._widget = widget
+        # Resolved references are cached on this instance; the widget swaps in
+        # a fresh namespace when its metadata object changes.
+        self._metadata = widget._widget_metadata
 
     def __getattr__(self, name: str) -> ComponentReference:
         reference = self._widget._resolve_component_reference(name)
         if reference is None:
             raise AttributeError(f"'{type(self._widget).__name__}.component' has no attribute '{name}'")
+        self.__dict__[name] = reference
         return reference
 
     def __dir__(self) -> list[str]:
@@ -108,27 +270,47 @@ class _OutputsNamespace:
 
     def __init__(self, widget: "VibeWidget"):
         object.__setattr__(self, "_widget", widget)
+        # Exports are fixed once the widget exists, so bind every handle up front;
+        # __getattr__ only serves late or error lookups.
+        widget_dict = widget.__dict__
+        accessors = widget_dict.get("_export_accessors")
+        if accessors is not None:
+            for name in widget_dict.get("_exports") or {}:
+                if name.startswith("_"):
+                    continue
+                handle = accessors.get(name)
+                if handle is None:
+                    handle = accessors[name] = ExportHandle(widget, name)
+                object.__setattr__(self, name, handle)
 
     def __getattr__(self, name: str) -> ExportHandle:
-        exports = getattr(self._widget, "_exports", {}) or {}
+        widget = self._widget
+        widget_dict = widget.__dict__
+        exports = widget_dict.get("_exports") or {}
         if name in exports:
-            accessors = getattr(self._widget, "_export_accessors", {})
-            if name not in accessors:
-                accessors[name] = ExportHandle(self._widget, name)
-            return accessors[name]
-        raise AttributeError(f"'{type(self._widget).__name__}.outputs' has no attribute '{name}'")
+            accessors = widget_dict.get("_export_accessors")
+            if accessors is None:
+                return ExportHandle(widget, name)
+            handle = accessors.get(name)
+            if handle is None:
+                handle = accessors[name] = ExportHandle(widget, name)
+            # Later lookups hit the instance dict and skip __getattr__
+            object.__setattr__(self, name, handle)
+            return handle
+        raise AttributeError(f"'{type(widget).__name__}.outputs' has no attribute '{name}'")
 
     def __dir__(self) -> list[str]:
-        exports = getattr(self._widget, "_exports", {}) or {}
-        return list(exports.keys())
+        exports = self._widget.__dict__.get("_exports") or {}
+        return list(exports)
 
     def __setattr__(self, name: str, value: Any) -> None:
         if name.startswith("_"):
             object.__setattr__(self, name, value)
             return
-        exports = getattr(self._widget, "_exports", {}) or {}
+        widget = self._widget
+        exports = widget.__dict__.get("_exports") or {}
         if name in exports:
-            setattr(self._widget, name, value)
+            setattr(widget, name, value)
             return
         raise AttributeError(f"'{type(self._widget).__name__}.outputs' has no attribute '{name}'")
 
@@ -155,6 +337,19 @@ class VibeWidget(anywidget.AnyWidget):
     execution_approved = traitlets.Bool(True).tag(sync=True)
     execution_approved_hash = traitlets.Unicode("").tag(sync=True)
 
+    # Class-level default covers attribute access before __init__ sets the real names
+    _export_names: frozenset[str] = frozenset()
+
+    # Trait name -> handler method, registered through a single observer
+    _CHANGE_HANDLERS = {
+        "error_message": "_on_error",
+        "grab_edit_request": "_on_grab_edit",
+        "audit_request": "_on_audit_request",
+        "audit_apply_request": "_on_audit_apply_request",
+        "code": "_on_code_change",
+        "execution_approved": "_on_execution_approved",
+    }
+
     def _ipython_display_(self) -> None:
         """Ensure rich display works in environments that skip mimebundle reprs."""
         try:
@@ -217,19 +412,23 @@ class VibeWidget(anywidget.AnyWidget):
         exports = exports or {}
         imports = imports or {}
 
-        dynamic_traits: dict[str, traitlets.TraitType] = {}
-        for export_name in exports.keys():
-            dynamic_traits[export_name] = traitlets.Any(default_value=None).tag(sync=True, to_json=_export_to_json_value)
-        for import_name in imports.keys():
-            if import_name not in dynamic_traits:
-                dynamic_traits[import_name] = traitlets.Any(default_value=None).tag(sync=True, to_json=_import_to_json_value)
-
-        widget_class = (
-            type("DynamicVibeWidget", (cls,), dynamic_traits) if dynamic_traits else cls
-        )
+        widget_class = cls
+        if exports or imports:
+            # Reuse the synthesized subclass for identical trait schemas
+            class_key = (cls, tuple(sorted(exports)), tuple(sorted(imports)))
+            widget_class = _DYNAMIC_CLASS_CACHE.get(class_key)
+            if widget_class is None:
+                dynamic_traits: dict[str, traitlets.TraitType] = {}
+                for export_name in exports:
+                    dynamic_traits[export_name] = traitlets.Any(default_value=None).tag(sync=True, to_json=_export_to_json_value)
+                for import_name in imports:
+                    if import_name not in dynamic_traits:
+                        dynamic_traits[import_name] = traitlets.Any(default_value=None).tag(sync=True, to_json=_import_to_json_value)
+                widget_class = type("DynamicVibeWidget", (cls,), dynamic_traits)
+                _DYNAMIC_CLASS_CACHE[class_key] = widget_class
 
         init_values: dict[str, Any] = {}
-        for export_name in exports.keys():
+        for export_name in exports:
             init_values[export_name] = None
         for import_name, import_source in imports.items():
             init_values[import_name] = initial_import_value(import_name, import_source)
@@ -296,24 +495,41 @@ class VibeWidget(anywidget.AnyWidget):
         parser = CodeStreamParser()
         self._exports = exports or {}
         self._imports = imports or {}
-        self._export_accessors: dict[str, ExportHandle] = {}
+        # Placeholder values stand in for live imported traits in prompts and cache keys
+        self._imports_serialized = {
+            import_name: f"<imported_trait:{import_name}>" for import_name in self._imports
+        }
+        self._export_accessors: dict[str, ExportHandle] = {
+            export_name: ExportHandle(self, export_name) for export_name in self._exports
+        }
+        # Names __getattribute__ answers with a handle; private and reserved names never wrap
+        self._export_names = frozenset(
+            export_name
+            for export_name in self._exports
+            if not export_name.startswith("_") and export_name not in _RESERVED_WIDGET_ATTRS
+        )
         self._outputs_namespace: _OutputsNamespace | None = None
         self._component_namespace: _ComponentNamespace | None = None
+        self._component_lookup_cache: tuple[Any, dict[str, str], dict[str, str]] | None = None
+        self._code_hash_cache: list[Any] | None = None
+        self._clean_data_info_cache: tuple[dict[str, Any], dict[str, Any]] | None = None
+        self._log_buffer: list[str] = []
+        self._last_log_flush = 0.0
+        # Edit handlers log from a worker thread; guards the buffer and the logs list
+        self._log_lock = threading.RLock()
+        # Handler name -> latest queued or running background edit
+        self._pending_edits: dict[str, Future] = {}
+        # Created on the first background edit; shut down in close()
+        self._edit_executor_instance: ThreadPoolExecutor | None = None
         self._widget_metadata = None
         self._theme = theme
         self._base_code = base_code
         self._base_components = base_components or []
         self._base_widget_id = base_widget_id
         
-        app_wrapper_dir = Path(__file__).parent
-        app_wrapper_path = app_wrapper_dir / "AppWrapper.bundle.js"
-        if not app_wrapper_path.exists():
-            # Fallback for older builds
-            app_wrapper_path = app_wrapper_dir / "app_wrapper.js"
-        self._esm = app_wrapper_path.read_text()
+        self._esm = _load_app_wrapper()
         
-        data_json = df.to_dict(orient="records")
-        data_json = clean_for_json(data_json)
+        data_json = dataframe_to_records(df)
         
         if execution_mode is None:
             execution_mode = "auto"
@@ -347,21 +563,17 @@ class VibeWidget(anywidget.AnyWidget):
         if display_widget:
             _display_widget(self)
         
-        self.observe(self._on_error, names='error_message')
-        self.observe(self._on_grab_edit, names='grab_edit_request')
-        self.observe(self._on_audit_request, names='audit_request')
-        self.observe(self._on_audit_apply_request, names='audit_apply_request')
-        self.observe(self._on_code_change, names='code')
-        self.observe(self._on_execution_approved, names='execution_approved')
+        self.observe(self._dispatch_change, names=list(self._CHANGE_HANDLERS))
         
         try:
-            self.logs = [f"Analyzing data: {df.shape[0]} rows × {df.shape[1]} columns"]
+            with self._log_lock:
+                self.logs = [f"Analyzing data: {df.shape[0]} rows × {df.shape[1]} columns"]
             
             resolved_model, config = _resolve_model(model)
             provider = OpenRouterProvider(resolved_model, config.api_key)
             
             if existing_code is not None:
-                self.logs = self.logs + ["Reusing existing widget code"]
+                self._append_logs(["Reusing existing widget code"])
                 self.code = existing_code
                 self.status = "ready"
                 self.description = description
@@ -369,44 +581,34 @@ class VibeWidget(anywidget.AnyWidget):
                 if self._theme and "theme_description" not in self._widget_metadata:
                     self._widget_metadata["theme_description"] = self._theme.description
                     self._widget_metadata["theme_name"] = self._theme.name
-                imports_serialized = {}
-                if self._imports:
-                    for import_name in self._imports.keys():
-                        imports_serialized[import_name] = f"<imported_trait:{import_name}>"
-                self.data_info = LLMProvider.build_data_info(
-                    df,
-                    self._exports,
-                    imports_serialized,
-                    theme_description=self._theme.description if self._theme else None,
-                )
+                self.data_info = self._build_data_info(df)
                 return
             
-            # Serialize imports for cache lookup
-            imports_serialized = {}
-            if self._imports:
-                for import_name in self._imports.keys():
-                    imports_serialized[import_name] = f"<imported_trait:{import_name}>"
+            imports_serialized = self._imports_serialized
             
-            store = WidgetStore()
+            store = _get_widget_store()
             cached_widget = None
             if cache:
-                cached_widget = store.lookup(
-                    description=description,
-                    data_var_name=data_var_name,
-                    data_shape=df.shape,
-                    exports=self._exports,
-                    imports_serialized=imports_serialized,
-                    theme_description=self._theme.description if self._theme else None,
-                )
+                with _STORE_LOCK:
+                    cached_widget = store.lookup(
+                        description=description,
+                        data_var_name=data_var_name,
+                        data_shape=df.shape,
+                        exports=self._exports,
+                        imports_serialized=imports_serialized,
+                        theme_description=self._theme.description if self._theme else None,
+                    )
             else:
-                self.logs = self.logs + ["Skipping cache (cache=False)"]
+                self._append_logs(["Skipping cache (cache=False)"])
             
-            self.orchestrator = AgenticOrchestrator(provider=provider)
+            self.orchestrator = AgenticOrchestrator(provider=provider, cache_responses=cache)
             
             if cached_widget:
-                self.logs = self.logs + ["✓ Found cached widget"]
-                self.logs = self.logs + [f"  {cached_widget['slug']} v{cached_widget['version']}"]
-                self.logs = self.logs + [f"  Created: {cached_widget['created_at'][:10]}"]
+                self._append_logs([
+                    "✓ Found cached widget",
+                    f"  {cached_widget['slug']} v{cached_widget['version']}",
+                    f"  Created: {cached_widget['created_at'][:10]}",
+                ])
                 widget_code = store.load_widget_code(cached_widget)
                 self.code = widget_code
                 self.status = "ready"
@@ -419,23 +621,19 @@ class VibeWidget(anywidget.AnyWidget):
                     )
                 
                 # Store data_info for error recovery
-                self.data_info = LLMProvider.build_data_info(
-                    df,
-                    self._exports,
-                    imports_serialized,
-                    theme_description=self._theme.description if self._theme else None,
-                )
+                self.data_info = self._build_data_info(df)
                 return
             
-            self.logs = self.logs + ["Generating widget code"]
+            self._append_logs(["Generating widget code"])
             
             chunk_buffer = []
+            chunk_buffer_len = 0
             update_counter = 0
             last_pattern_count = 0
             
             def stream_callback(event_type: str, message: str):
                 """Handle progress events from orchestrator."""
-                nonlocal update_counter, last_pattern_count
+                nonlocal update_counter, last_pattern_count, chunk_buffer_len
                 
                 event_messages = {
                     "step": f"{message}",
@@ -449,6 +647,7 @@ class VibeWidget(anywidget.AnyWidget):
                 
                 if event_type == "chunk":
                     chunk_buffer.append(message)
+                    chunk_buffer_len += len(message)
                     update_counter += 1
                     
                     updates = parser.parse_chunk(message)
@@ -456,29 +655,28 @@ class VibeWidget(anywidget.AnyWidget):
                     should_update = (
                         update_counter % 30 == 0 or 
                         parser.has_new_pattern() or
-                        len(''.join(chunk_buffer)) > 500
+                        chunk_buffer_len > 500
                     )
                     
                     if should_update:
                         if chunk_buffer:
                             chunk_buffer.clear()
+                            chunk_buffer_len = 0
                         
-                        for update in updates:
-                            if update["type"] == "micro_bubble":
-                                current_logs = list(self.logs)
-                                current_logs.append(update["message"])
-                                self.logs = current_logs
+                        pending_logs = [
+                            update["message"]
+                            for update in updates
+                            if update["type"] == "micro_bubble"
+                        ]
                         
                         current_pattern_count = len(parser.detected)
                         if current_pattern_count == last_pattern_count and update_counter % 100 == 0:
-                            current_logs = list(self.logs)
-                            current_logs.append(f"Generating code ({update_counter} chunks)")
-                            self.logs = current_logs
+                            pending_logs.append(f"Generating code ({update_counter} chunks)")
                         last_pattern_count = current_pattern_count
+                        if pending_logs:
+                            self._queue_logs(pending_logs)
                 else:
-                    current_logs = list(self.logs)
-                    current_logs.append(display_msg)
-                    self.logs = current_logs
+                    self._queue_logs([display_msg])
             
             # Generate code using the agentic orchestrator
             widget_code, processed_df = self.orchestrator.generate(
@@ -492,72 +690,152 @@ class VibeWidget(anywidget.AnyWidget):
                 progress_callback=stream_callback,
             )
             
-            current_logs = list(self.logs)
-            current_logs.append(f"Code generated: {len(widget_code)} characters")
-            self.logs = current_logs
+            self._append_logs([f"Code generated: {len(widget_code)} characters"])
             
             # Save to widget store (reuse store instance from cache lookup)
             notebook_path = store.get_notebook_path()
-            widget_entry = store.save(
-                widget_code=widget_code,
-                description=description,
-                data_var_name=data_var_name,
-                data_shape=df.shape,
-                model=resolved_model,
-                exports=self._exports,
-                imports_serialized=imports_serialized,
-                theme_name=self._theme.name if self._theme else None,
-                theme_description=self._theme.description if self._theme else None,
-                notebook_path=notebook_path,
-            )
-            
-            # Update widget_entry with base_widget_id if this is a revision
-            if self._base_widget_id:
-                widget_entry["base_widget_id"] = self._base_widget_id
-                # Update in index
-                for entry in store.index["widgets"]:
-                    if entry["id"] == widget_entry["id"]:
-                        entry["base_widget_id"] = self._base_widget_id
-                        break
+            with _STORE_LOCK:
+                widget_entry = store.save(
+                    widget_code=widget_code,
+                    description=description,
+                    data_var_name=data_var_name,
+                    data_shape=df.shape,
+                    model=resolved_model,
+                    exports=self._exports,
+                    imports_serialized=imports_serialized,
+                    theme_name=self._theme.name if self._theme else None,
+                    theme_description=self._theme.description if self._theme else None,
+                    notebook_path=notebook_path,
+                    defer_index=True,
+                )
+                
+                # Update widget_entry with base_widget_id if this is a revision
+                if self._base_widget_id:
+                    widget_entry["base_widget_id"] = self._base_widget_id
+                    # Update in index
+                    indexed_entry = store.get_entry_by_id(widget_entry["id"])
+                    if indexed_entry is not None:
+                        indexed_entry["base_widget_id"] = self._base_widget_id
                 store._save_index()
             
-            self.logs = self.logs + [f"Widget saved: {widget_entry['slug']} v{widget_entry['version']}"]
-            self.logs = self.logs + [f"Location: .vibewidget/widgets/{widget_entry['file_name']}"]
+            self._append_logs([
+                f"Widget saved: {widget_entry['slug']} v{widget_entry['version']}",
+                f"Location: .vibewidget/widgets/{widget_entry['file_name']}",
+            ])
             self.code = widget_code
             self.status = "ready"
             self.description = description
             self._widget_metadata = widget_entry
             
             # Store data_info for error recovery  (build from LLMProvider method)
-            self.data_info = LLMProvider.build_data_info(
-                df,
-                self._exports,
-                imports_serialized,
-                theme_description=self._theme.description if self._theme else None,
-            )
+            self.data_info = self._build_data_info(df)
             
         except Exception as e:
             self.status = "error"
-            self.logs = self.logs + [f"Error: {str(e)}"]
+            self._append_logs([f"Error: {str(e)}"])
             raise
 
+    def _build_data_info(self, df: pd.DataFrame) -> dict[str, Any]:
+        """Build prompt data info for df with this widget's exports, imports and theme."""
+        return LLMProvider.build_data_info(
+            df,
+            self._exports,
+            self._imports_serialized,
+            theme_description=self._theme.description if self._theme else None,
+        )
+
+    def _get_clean_data_info(self) -> dict[str, Any]:
+        """Return the JSON-safe form of data_info, cached until data_info is replaced."""
+        data_info = self.data_info
+        cached = self._clean_data_info_cache
+        if cached is not None and cached[0] is data_info:
+            return cached[1]
+        clean = clean_for_json(data_info)
+        self._clean_data_info_cache = (data_info, clean)
+        return clean
+
+    def _dispatch_change(self, change: dict[str, Any]) -> None:
+        """Route observed trait changes to their handler.
+
+        Grab edits, audit-apply requests and runtime-error fixes run on the
+        widget's edit worker, so setting grab_edit_request, audit_apply_request
+        or error_message returns before the edit has finished. Watch ``status``
+        (or ``edit_in_progress``) to know when the new code is in place.
+        """
+        handler_name = self._CHANGE_HANDLERS[change["name"]]
+        if handler_name in _BACKGROUND_HANDLERS:
+            # Resets to an empty value are no-ops for these handlers
+            if change["new"]:
+                pending = self._pending_edits
+                previous = pending.get(handler_name)
+                # Latest request wins: drop one of the same kind that has not started yet
+                if previous is not None:
+                    previous.cancel()
+                future = self._edit_executor().submit(getattr(self, handler_name), change)
+                future.add_done_callback(_report_background_error)
+                pending[handler_name] = future
+            return
+        getattr(self, handler_name)(change)
+
+    def close(self) -> None:
+        """Close the widget and stop its edit worker, dropping edits not yet started."""
+        # __del__ calls close(), possibly on a widget whose __init__ never ran
+        executor = getattr(self, "_edit_executor_instance", None)
+        if executor is not None:
+            self._edit_executor_instance = None
+            executor.shutdown(wait=False, cancel_futures=True)
+        super().close()
+
+    def _edit_executor(self) -> ThreadPoolExecutor:
+        """Single-worker executor so LLM edits never block the kernel and run in order."""
+        if self._edit_executor_instance is None:
+            self._edit_executor_instance = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="vibe-widget-edit"
+            )
+        return self._edit_executor_instance
+
+    def _append_logs(self, lines: list[str]) -> None:
+        """Append log lines with a single trait assignment (one frontend sync)."""
+        with self._log_lock:
+            pending = self._log_buffer
+            logs = self.logs
+            if pending:
+                logs.extend(pending)
+                pending.clear()
+            logs.extend(lines)
+            # Mutated in place, so notify explicitly; this still syncs the full list once
+            self._notify_trait("logs", logs, logs)
+            self._last_log_flush = time.monotonic()
+
+    def _queue_logs(self, lines: list[str]) -> None:
+        """Buffer streaming log lines, syncing at most every few lines or 100ms."""
+        with self._log_lock:
+            pending = self._log_buffer
+            pending.extend(lines)
+            if (
+                len(pending) >= _LOG_FLUSH_LINES
+                or time.monotonic() - self._last_log_flush >= _LOG_FLUSH_INTERVAL
+            ):
+                self._flush_log_buffer()
+
+    def _flush_log_buffer(self) -> None:
+        """Sync any buffered log lines to the frontend."""
+        if self._log_buffer:
+            self._append_logs([])
+
+    def _prompt_cache_logs(self) -> list[str]:
+        """Log lines reporting prompt tokens served from the provider cache, if any."""
+        if self.orchestrator.last_response_cached:
+            # No provider call was made; its token counts belong to an earlier one
+            return []
+        cached = getattr(self.orchestrator.provider, "last_cached_tokens", 0)
+        return [f"Prompt cache: {cached} tokens reused"] if cached else []
+
     def __getattribute__(self, name: str):
         """Return callable handles for exports to support import chaining."""
-        if not name.startswith("_") and name not in {"outputs", "component"}:
-            try:
-                exports = object.__getattribute__(self, "_exports")
-                if name in exports:
-                    # Avoid wrapping when traitlets is serializing state
-                    for frame in inspect.stack()[1:4]:
-                        if frame.function in {"get_state", "_trait_to_json", "_should_send_property"} or "traitlets" in frame.filename:
-                            return super().__getattribute__(name)
-                    accessors = object.__getattribute__(self, "_export_accessors")
-                    if name not in accessors:
-                        accessors[name] = ExportHandle(self, name)
-                    return accessors[name]
-            except Exception:
-                # Fall back to default lookup for early init or missing attrs
-                pass
+        # Avoid wrapping when traitlets is serializing state
+        if name in object.__getattribute__(self, "_export_names") and not _called_from_serializer():
+            return object.__getattribute__(self, "_export_accessors")[name]
         return super().__getattribute__(name)
 
     # --- Convenience rerun API ---
@@ -567,7 +845,7 @@ class VibeWidget(anywidget.AnyWidget):
         description: str,
         data_source: Any,
         data_type: type | None,
-        data_columns: list[str] | None,
+        data_columns: tuple[str, ...] | None,
         exports: dict[str, str] | None,
         imports: dict[str, Any] | None,
         model: str,
@@ -582,6 +860,10 @@ class VibeWidget(anywidget.AnyWidget):
         self._recipe_data_columns = data_columns
         self._recipe_exports = exports
         self._recipe_imports = imports
+        # (name, type) pairs used by _rerun_with to match a positional override
+        self._recipe_import_types = tuple(
+            (name, type(source)) for name, source in (imports or {}).items() if source is not None
+        )
         self._recipe_model = model
         self._recipe_model_resolved = model
         self._recipe_theme = theme
@@ -593,7 +875,7 @@ class VibeWidget(anywidget.AnyWidget):
         """Create a new widget instance, swapping data/inputs heuristically."""
         if not args and not kwargs:
             return self._rerun_with()
-        if not args and set(kwargs.keys()) == {"display"}:
+        if not args and set(kwargs) == {"display"}:
             return self._rerun_with(**kwargs)
         return self._rerun_with(*args, **kwargs)
 
@@ -616,7 +898,7 @@ class VibeWidget(anywidget.AnyWidget):
                 "description": metadata.get("theme_description"),
             }
 
-        inputs_signature = {name: "<input>" for name in (self._imports or {}).keys()}
+        inputs_signature = {name: "<input>" for name in (self._imports or {})}
         if self.data:
             inputs_signature.setdefault("data", "<input>")
         save_inputs = {"embedded": False, "values": {}}
@@ -638,8 +920,7 @@ class VibeWidget(anywidget.AnyWidget):
         }
 
         target.parent.mkdir(parents=True, exist_ok=True)
-        with open(target, "w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2, ensure_ascii=True)
+        target.write_bytes(dumps_json(payload, indent=True))
         return target
 
     def _rerun_with(self, *args, **kwargs) -> "VibeWidget":
@@ -676,9 +957,9 @@ class VibeWidget(anywidget.AnyWidget):
                     matched = True
                 if not matched:
                     # Try to swap an import with the same type
-                    for name, source in (self._recipe_imports or {}).items():
-                        if source is not None and isinstance(arg, type(source)):
-                            merged = dict(self._recipe_imports or {})
+                    for name, source_type in self._recipe_import_types:
+                        if isinstance(arg, source_type):
+                            merged = dict(self._recipe_imports)
                             merged[name] = arg
                             candidate_imports = merged
                             matched = True
@@ -772,13 +1053,19 @@ class VibeWidget(anywidget.AnyWidget):
     def _parse_audit_json(self, raw_text: str) -> dict[str, Any]:
         """Parse JSON from LLM output with a best-effort fallback."""
         try:
-            return json.loads(raw_text)
+            return loads_json(raw_text)
         except json.JSONDecodeError:
             start = raw_text.find("{")
-            end = raw_text.rfind("}")
-            if start != -1 and end != -1 and end > start:
-                return json.loads(raw_text[start:end + 1])
-            raise
+            if start == -1:
+                raise
+            try:
+                # Decode the first object in place; trailing prose is ignored
+                return _JSON_DECODER.raw_decode(raw_text, start)[0]
+            except json.JSONDecodeError:
+                end = raw_text.rfind("}")
+                if end > start:
+                    return json.loads(raw_text[start:end + 1])
+                raise
 
     def _normalize_audit_report(
         self,
@@ -803,95 +1090,76 @@ class VibeWidget(anywidget.AnyWidget):
         if not isinstance(raw_concerns, list):
             raw_concerns = []
 
-        normalized_concerns: list[dict[str, Any]] = []
+        default_impact = "medium" if level == "full" else "low"
+        # Sized up front; non-dict entries are skipped and the tail trimmed afterwards
+        normalized_concerns: list[Any] = [None] * len(raw_concerns)
+        count = 0
         for concern in raw_concerns:
             if not isinstance(concern, dict):
                 continue
-            location = normalize_location(concern.get("location", "global"))
             impact = str(concern.get("impact", "low")).lower()
-            if level == "full" and impact not in {"high", "medium", "low"}:
-                impact = "medium"
-            if level == "fast" and impact not in {"high", "medium", "low"}:
-                impact = "low"
+            if impact not in _AUDIT_IMPACT_LEVELS:
+                impact = default_impact
 
             alternatives = concern.get("alternatives", [])
             if not isinstance(alternatives, list):
                 alternatives = []
             if level == "full":
-                normalized_alts = []
-                for item in alternatives:
-                    if isinstance(item, dict):
-                        normalized_alts.append({
-                            "option": str(item.get("option", "")).strip(),
-                            "when_better": str(item.get("when_better", "")).strip(),
-                            "when_worse": str(item.get("when_worse", "")).strip(),
-                        })
-                    else:
-                        normalized_alts.append({
-                            "option": str(item).strip(),
-                            "when_better": "",
-                            "when_worse": "",
-                        })
-                alternatives = normalized_alts
+                alternatives = [
+                    {field: str(item.get(field, "")).strip() for field in _AUDIT_ALTERNATIVE_FIELDS}
+                    if isinstance(item, dict)
+                    else {"option": str(item).strip(), "when_better": "", "when_worse": ""}
+                    for item in alternatives
+                ]
 
             normalized = {
                 "id": str(concern.get("id", "")).strip() or "concern.unknown",
-                "location": location,
-                "summary": str(concern.get("summary", "")).strip(),
-                "details": str(concern.get("details", "")).strip(),
-                "technical_summary": str(concern.get("technical_summary", "")).strip(),
-                "impact": impact,
-                "default": bool(concern.get("default", False)),
-                "alternatives": alternatives,
+                "location": normalize_location(concern.get("location", "global")),
             }
+            for field in _AUDIT_CONCERN_TEXT_FIELDS:
+                normalized[field] = str(concern.get(field, "")).strip()
+            normalized["impact"] = impact
+            normalized["default"] = bool(concern.get("default", False))
+            normalized["alternatives"] = alternatives
             if level == "full":
                 lenses = concern.get("lenses", {})
                 if not isinstance(lenses, dict):
                     lenses = {}
                 normalized["rationale"] = str(concern.get("rationale", "")).strip()
-                normalized["lenses"] = {
-                    "impact": str(lenses.get("impact", "medium")).lower(),
-                    "uncertainty": str(lenses.get("uncertainty", "")).strip(),
-                    "reproducibility": str(lenses.get("reproducibility", "")).strip(),
-                    "edge_behavior": str(lenses.get("edge_behavior", "")).strip(),
-                    "default_vs_explicit": str(lenses.get("default_vs_explicit", "")).strip(),
-                    "appropriateness": str(lenses.get("appropriateness", "")).strip(),
-                    "safety": str(lenses.get("safety", "")).strip(),
-                }
-            normalized_concerns.append(normalized)
+                normalized_lenses = {"impact": str(lenses.get("impact", "medium")).lower()}
+                for field in _AUDIT_LENS_TEXT_FIELDS:
+                    normalized_lenses[field] = str(lenses.get(field, "")).strip()
+                normalized["lenses"] = normalized_lenses
+            normalized_concerns[count] = normalized
+            count += 1
+        del normalized_concerns[count:]
 
         payload["concerns"] = normalized_concerns
         open_questions = payload.get("open_questions", [])
         if not isinstance(open_questions, list):
             open_questions = []
-        payload["open_questions"] = [str(q).strip() for q in open_questions if str(q).strip()]
+        payload["open_questions"] = _clean_text_items(open_questions)
         safety = payload.get("safety", {})
         if not isinstance(safety, dict):
             safety = {}
         checks = safety.get("checks", {})
         if not isinstance(checks, dict):
             checks = {}
-        def _normalize_check(key: str) -> dict[str, str]:
+        normalized_checks = {}
+        for key in _AUDIT_SAFETY_CHECKS:
             raw = checks.get(key, {})
             if not isinstance(raw, dict):
                 raw = {}
             status = str(raw.get("status", "unknown")).lower()
-            if status not in {"yes", "no", "unknown"}:
+            if status not in _AUDIT_CHECK_STATUSES:
                 status = "unknown"
-            return {
+            normalized_checks[key] = {
                 "status": status,
                 "evidence": str(raw.get("evidence", "")).strip(),
                 "notes": str(raw.get("notes", "")).strip(),
             }
-        normalized_checks = {
-            "external_network_usage": _normalize_check("external_network_usage"),
-            "dynamic_code_execution": _normalize_check("dynamic_code_execution"),
-            "storage_writes": _normalize_check("storage_writes"),
-            "cross_origin_fetch": _normalize_check("cross_origin_fetch"),
-            "iframe_script_injection": _normalize_check("iframe_script_injection"),
-        }
         risk_level = str(safety.get("risk_level", "unknown")).lower()
-        if risk_level not in {"low", "medium", "high", "unknown"}:
+        if risk_level not in _AUDIT_RISK_LEVELS:
             risk_level = "unknown"
         caveats = safety.get("caveats", [])
         if not isinstance(caveats, list):
@@ -899,10 +1167,27 @@ class VibeWidget(anywidget.AnyWidget):
         payload["safety"] = {
             "checks": normalized_checks,
             "risk_level": risk_level,
-            "caveats": [str(c).strip() for c in caveats if str(c).strip()],
+            "caveats": _clean_text_items(caveats),
         }
         return {root_key: payload}
 
+    def _code_hash_entry(self, code: str) -> list[Any]:
+        """Return the [code, code hash, line hashes or None] cache entry for this code string."""
+        entry = self._code_hash_cache
+        if entry is None or entry[0] is not code:
+            entry = self._code_hash_cache = [code, compute_code_hash(code), None]
+        return entry
+
+    def _code_hash(self, code: str) -> str:
+        return self._code_hash_entry(code)[1]
+
+    def _line_hashes(self, code: str) -> dict[int, str]:
+        """Line hashes for code, computed only when a caller needs them."""
+        entry = self._code_hash_entry(code)
+        if entry[2] is None:
+            entry[2] = compute_line_hashes(code)
+        return entry[2]
+
     def _run_audit(
         self,
         *,
@@ -922,9 +1207,8 @@ class VibeWidget(anywidget.AnyWidget):
         code = self.code
         widget_metadata = self._widget_metadata or {}
         widget_description = self.description or widget_metadata.get("description", "Widget")
-        store = AuditStore()
-        current_code_hash = compute_code_hash(code)
-        current_line_hashes = compute_line_hashes(code)
+        store = _get_audit_store()
+        current_code_hash = self._code_hash(code)
 
         previous_audit = None
         if reuse and widget_metadata.get("id"):
@@ -936,6 +1220,8 @@ class VibeWidget(anywidget.AnyWidget):
         stale_concerns: list[dict[str, Any]] = []
         previous_questions: list[str] = []
         changed_lines: list[int] | None = None
+        current_line_hashes: dict[int, str] | None = None
+        prev_line_items: set[tuple[int, Any]] | None = None
 
         if reuse and previous_audit:
             prev_report = previous_audit.get("report", {})
@@ -948,12 +1234,17 @@ class VibeWidget(anywidget.AnyWidget):
             if not isinstance(previous_questions, list):
                 previous_questions = []
 
+            # Identical code means every well-formed concern still matches its lines
+            code_unchanged = prev_code_hash == current_code_hash
+            # Line hashes are only needed to check concerns against changed code
+            if not code_unchanged:
+                current_line_hashes = self._line_hashes(code)
             for concern in prev_concerns:
                 if not isinstance(concern, dict):
                     continue
                 location = normalize_location(concern.get("location", "global"))
                 if location == "global":
-                    if prev_code_hash == current_code_hash:
+                    if code_unchanged:
                         reused_concerns.append(concern)
                     else:
                         stale_concerns.append(concern)
@@ -962,15 +1253,15 @@ class VibeWidget(anywidget.AnyWidget):
                 if not isinstance(line_hashes, list) or not line_hashes or len(line_hashes) != len(location):
                     stale_concerns.append(concern)
                     continue
-                current_matches = []
-                for line_num, expected_hash in zip(location, line_hashes):
-                    current_matches.append(current_line_hashes.get(int(line_num)) == expected_hash)
-                if all(current_matches):
+                if code_unchanged or all(
+                    current_line_hashes.get(line_num) == expected_hash
+                    for line_num, expected_hash in zip(location, line_hashes)
+                ):
                     reused_concerns.append(concern)
                 else:
                     stale_concerns.append(concern)
 
-            if not stale_concerns and prev_code_hash == current_code_hash:
+            if not stale_concerns and code_unchanged:
                 report_public = strip_internal_fields(prev_report)
                 self.audit_status = "idle"
                 result = {
@@ -984,29 +1275,33 @@ class VibeWidget(anywidget.AnyWidget):
                 }
                 self.audit_response = result
                 if display:
-                    try:
-                        from IPython.display import display, Markdown
-                        display(Markdown(f"```yaml\n{result['report_yaml']}\n```"))
-                    except Exception:
-                        print(result["report_yaml"])
+                    _show_audit_yaml(result["report_yaml"])
                 return result
 
-            prev_line_hashes_int = {int(k): v for k, v in prev_line_hashes.items()} if isinstance(prev_line_hashes, dict) else {}
-            max_line = max(max(prev_line_hashes_int.keys(), default=0), max(current_line_hashes.keys(), default=0))
-            changed = []
-            for line_num in range(1, max_line + 1):
-                if prev_line_hashes_int.get(line_num) != current_line_hashes.get(line_num):
-                    changed.append(line_num)
-            changed_lines = changed or None
-
-        clean_data_info = clean_for_json(self.data_info)
-        numbered_code = render_numbered_code(code)
+            prev_line_items = (
+                {(int(k), v) for k, v in prev_line_hashes.items()} if isinstance(prev_line_hashes, dict) else set()
+            )
 
-        provider = getattr(self, "orchestrator", None).provider if getattr(self, "orchestrator", None) else None
+        orchestrator = getattr(self, "orchestrator", None)
+        provider = orchestrator.provider if orchestrator else None
         if provider is None:
             resolved_model, config = _resolve_model(widget_metadata.get("model"))
             provider = OpenRouterProvider(resolved_model, config.api_key)
 
+        # Prompt inputs are only built once the audit is known to need the LLM
+        if current_line_hashes is None:
+            current_line_hashes = self._line_hashes(code)
+        if prev_line_items is not None:
+            # Lines whose hash differs, or that exist on only one side
+            changed = sorted({
+                line_num
+                for line_num, _ in prev_line_items.symmetric_difference(current_line_hashes.items())
+                if line_num >= 1
+            })
+            changed_lines = changed or None
+        clean_data_info = self._get_clean_data_info()
+        numbered_code = render_numbered_code(code)
+
         raw_report = provider.generate_audit_report(
             code=numbered_code,
             description=widget_description,
@@ -1022,13 +1317,13 @@ class VibeWidget(anywidget.AnyWidget):
         new_concerns = payload.get("concerns", [])
         filtered_concerns: list[dict[str, Any]] = []
         for concern in new_concerns:
-            location = normalize_location(concern.get("location", "global"))
-            concern["location"] = location
+            # Already normalized by _normalize_audit_report
+            location = concern["location"]
             if changed_lines and location != "global":
                 if not any(line in changed_lines for line in location):
                     continue
             if location != "global":
-                concern["line_hashes"] = [current_line_hashes.get(int(line)) for line in location]
+                concern["line_hashes"] = [current_line_hashes.get(line) for line in location]
             filtered_concerns.append(concern)
 
         merged_concerns = reused_concerns[:]
@@ -1041,9 +1336,10 @@ class VibeWidget(anywidget.AnyWidget):
         new_questions = payload.get("open_questions", [])
         if not isinstance(new_questions, list):
             new_questions = []
-        merged_questions = list(dict.fromkeys([*previous_questions, *new_questions]))
+        merged_questions = dict.fromkeys(previous_questions)
+        merged_questions.update(dict.fromkeys(new_questions))
         payload["concerns"] = merged_concerns
-        payload["open_questions"] = merged_questions
+        payload["open_questions"] = list(merged_questions)
         normalized_report[root_key] = payload
 
         report_public = strip_internal_fields(normalized_report)
@@ -1074,11 +1370,7 @@ class VibeWidget(anywidget.AnyWidget):
         self.audit_status = "idle"
         self.audit_response = result
         if display:
-            try:
-                from IPython.display import display, Markdown
-                display(Markdown(f"```yaml\n{report_yaml}\n```"))
-            except Exception:
-                print(report_yaml)
+            _show_audit_yaml(report_yaml)
         return result
 
     def _on_audit_request(self, change):
@@ -1120,35 +1412,27 @@ class VibeWidget(anywidget.AnyWidget):
         self.audit_apply_error = ""
         self.status = "generating"
 
+        # One flat list of lines for every change, joined once below
         change_lines = []
         for item in changes:
             if not isinstance(item, dict):
                 continue
             summary = str(item.get("summary") or item.get("label") or "").strip()
-            details = str(item.get("details") or "").strip()
-            technical = str(item.get("technical_summary") or "").strip()
-            user_note = str(item.get("user_note") or "").strip()
-            alternative = str(item.get("alternative") or "").strip()
             location = item.get("location")
             if isinstance(location, list) and location:
                 location_str = f"lines {', '.join(str(x) for x in location)}"
             else:
                 location_str = "global"
-            parts = [f"- {summary or 'Change'} ({location_str})"]
-            if alternative:
-                parts.append(f"  alternative: {alternative}")
-            if user_note:
-                parts.append(f"  user_note: {user_note}")
-            if details:
-                parts.append(f"  details: {details}")
-            if technical:
-                parts.append(f"  technical: {technical}")
-            change_lines.append("\n".join(parts))
+            change_lines.append(f"- {summary or 'Change'} ({location_str})")
+            for field, label in _AUDIT_APPLY_FIELDS:
+                value = str(item.get(field) or "").strip()
+                if value:
+                    change_lines.append(f"  {label}: {value}")
 
         revision_request = "Apply these audit changes:\n" + "\n".join(change_lines)
 
         try:
-            clean_data_info = clean_for_json(self.data_info)
+            clean_data_info = self._get_clean_data_info()
             revised_code = self.orchestrator.revise_code(
                 code=base_code,
                 revision_request=revision_request,
@@ -1180,26 +1464,27 @@ class VibeWidget(anywidget.AnyWidget):
         self.status = 'generating'
         
         error_preview = error_msg.split('\n')[0][:100]
-        self.logs = self.logs + [f"Error detected: {error_preview}"]
-        self.logs = self.logs + ["Asking LLM to fix the error"]
+        self._append_logs([f"Error detected: {error_preview}", "Asking LLM to fix the error"])
         
         try:
-            clean_data_info = clean_for_json(self.data_info)
+            clean_data_info = self._get_clean_data_info()
             
             fixed_code = self.orchestrator.fix_runtime_error(
                 code=self.code,
                 error_message=error_msg,
                 data_info=clean_data_info,
+                # A retry means the previous fix failed; ask for a fresh one
+                use_cache=self.retry_count == 1,
             )
             
-            self.logs = self.logs + ["Code fixed, retrying"]
+            self._append_logs(["Code fixed, retrying", *self._prompt_cache_logs()])
             self.code = fixed_code
             self.status = 'ready'
             self.error_message = ""
             self.retry_count = 0
         except Exception as e:
             self.status = "error"
-            self.logs = self.logs + [f"Fix attempt failed: {str(e)}"]
+            self._append_logs([f"Fix attempt failed: {str(e)}"])
             self.error_message = ""
     
     @property
@@ -1212,34 +1497,48 @@ class VibeWidget(anywidget.AnyWidget):
     @property
     def component(self) -> _ComponentNamespace:
         """Namespace accessor for widget components."""
-        if self._component_namespace is None:
-            self._component_namespace = _ComponentNamespace(self)
-        return self._component_namespace
+        namespace = self._component_namespace
+        if namespace is None or namespace._metadata is not self._widget_metadata:
+            namespace = self._component_namespace = _ComponentNamespace(self)
+        return namespace
+
+    def _component_lookup(self) -> tuple[dict[str, str], dict[str, str]]:
+        """Return (attr name -> component, lowercase name -> component) maps.
+
+        Rebuilt only when the metadata's components list is replaced.
+        """
+        metadata = self._widget_metadata
+        components = (metadata.get("components") if metadata else None) or ()
+        cached = self._component_lookup_cache
+        if cached is not None and cached[0] is components:
+            return cached[1], cached[2]
+        by_attr: dict[str, str] = {}
+        by_lower: dict[str, str] = {}
+        for comp in components:
+            # First match wins, as with the previous linear scan
+            by_attr.setdefault(self._to_python_attr(comp), comp)
+            by_lower.setdefault(comp.lower(), comp)
+        self._component_lookup_cache = (components, by_attr, by_lower)
+        return by_attr, by_lower
 
     def _component_attr_names(self) -> list[str]:
-        components = []
-        if hasattr(self, "_widget_metadata") and self._widget_metadata and "components" in self._widget_metadata:
-            components = self._widget_metadata["components"] or []
-        return [self._to_python_attr(comp) for comp in components]
+        return list(self._component_lookup()[0])
 
     def _resolve_component_reference(self, name: str) -> ComponentReference | None:
-        if not hasattr(self, "_widget_metadata") or not self._widget_metadata or "components" not in self._widget_metadata:
+        by_attr, by_lower = self._component_lookup()
+        comp = by_attr.get(name) or by_lower.get(name.lower())
+        if comp is None:
             return None
-        components = self._widget_metadata["components"]
-        for comp in components:
-            if self._to_python_attr(comp) == name or comp.lower() == name.lower():
-                return ComponentReference(self, comp)
-        return None
+        return ComponentReference(self, comp)
 
     def __dir__(self):
         """Return list of attributes including outputs/component helpers for autocomplete."""
-        # Get default attributes
-        default_attrs = object.__dir__(self)
-        export_attrs: list[str] = []
-        
-        if hasattr(self, "_exports") and self._exports:
-            export_attrs = list(self._exports.keys())
-        return list(set(default_attrs + export_attrs + ["outputs", "component"]))
+        names = set(object.__dir__(self))
+        exports = getattr(self, "_exports", None)
+        if exports:
+            names.update(exports)
+        names.update(_RESERVED_WIDGET_ATTRS)
+        return list(names)
     
     def __getattr__(self, name: str):
         """
@@ -1249,13 +1548,15 @@ class VibeWidget(anywidget.AnyWidget):
             scatter.component.slider -> ComponentReference
             scatter.component.color_legend -> ComponentReference
         """
-        # Avoid infinite recursion for special attributes
-        if name.startswith('_'):
-            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
-        
-        reference = self._resolve_component_reference(name)
-        if reference is not None:
-            return reference
+        # Avoid infinite recursion for special attributes. Other misses (IPython
+        # and Jupyter probes) stop at the cached lookup maps, and widgets without
+        # components raise as soon as they see the maps are empty.
+        if not name.startswith('_'):
+            by_attr, by_lower = self._component_lookup()
+            if by_lower:
+                comp = by_attr.get(name) or by_lower.get(name.lower())
+                if comp is not None:
+                    return ComponentReference(self, comp)
         
         raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
@@ -1264,12 +1565,12 @@ class VibeWidget(anywidget.AnyWidget):
         return super().__getattribute__(export_name)
     
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def _to_python_attr(component_name: str) -> str:
         """Convert PascalCase component name to snake_case attribute."""
         # Insert underscore before uppercase letters and convert to lowercase
-        import re
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', component_name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+        s1 = _CAMEL_WORD_RE.sub(r'\1_\2', component_name)
+        return _CAMEL_BOUNDARY_RE.sub(r'\1_\2', s1).lower()
 
     def _on_grab_edit(self, change):
         """Handle element edit requests from frontend (React Grab)."""
@@ -1288,7 +1589,8 @@ class VibeWidget(anywidget.AnyWidget):
         self._pending_old_code = old_code
         self.edit_in_progress = True
         self.status = 'generating'
-        self.logs = [f"Editing: {user_prompt[:50]}{'...' if len(user_prompt) > 50 else ''}"]
+        with self._log_lock:
+            self.logs = [f"Editing: {user_prompt[:50]}{'...' if len(user_prompt) > 50 else ''}"]
         
         old_position = 0
         showed_analyzing = False
@@ -1297,6 +1599,7 @@ class VibeWidget(anywidget.AnyWidget):
         parser = RevisionStreamParser()
         
         WINDOW_SIZE = 200
+        old_code_len = len(old_code)
         
         def progress_callback(event_type: str, message: str):
             """Stream progress updates to frontend."""
@@ -1306,38 +1609,40 @@ class VibeWidget(anywidget.AnyWidget):
                 chunk = message
                 
                 if not showed_analyzing:
-                    self.logs = self.logs + ["Analyzing code"]
+                    self._queue_logs(["Analyzing code"])
                     showed_analyzing = True
                 
-                window_start = max(0, old_position - WINDOW_SIZE)
-                window_end = min(len(old_code), old_position + WINDOW_SIZE + len(chunk))
-                window = old_code[window_start:window_end]
-                
-                found_at = window.find(chunk)
+                # Bounded search directly on old_code; no per-chunk window copy
+                found_at = old_code.find(
+                    chunk,
+                    max(0, old_position - WINDOW_SIZE),
+                    min(old_code_len, old_position + WINDOW_SIZE + len(chunk)),
+                )
                 
                 if found_at != -1:
-                    old_position = window_start + found_at + len(chunk)
+                    old_position = found_at + len(chunk)
                 else:
                     if not showed_applying:
-                        self.logs = self.logs + ["Applying changes"]
+                        self._queue_logs(["Applying changes"])
                         showed_applying = True
                     
                     updates = parser.parse_chunk(chunk)
                     if parser.has_new_pattern():
-                        for update in updates:
-                            if update["type"] == "micro_bubble":
-                                self.logs = self.logs + [update["message"]]
+                        self._queue_logs([
+                            update["message"] for update in updates
+                            if update["type"] == "micro_bubble"
+                        ])
                 return
             
             if event_type == "complete":
-                self.logs = self.logs + [f"✓ {message}"]
+                self._append_logs([f"✓ {message}"])
             elif event_type == "error":
-                self.logs = self.logs + [f"✘ {message}"]
+                self._append_logs([f"✘ {message}"])
         
         try:
             revision_request = self._build_grab_revision_request(element_desc, user_prompt)
             
-            clean_data_info = clean_for_json(self.data_info)
+            clean_data_info = self._get_clean_data_info()
             
             revised_code = self.orchestrator.revise_code(
                 code=self.code,
@@ -1348,44 +1653,44 @@ class VibeWidget(anywidget.AnyWidget):
             
             self.code = revised_code
             self.status = 'ready'
-            self.logs = self.logs + ['✓ Edit applied']
-            
-            store = WidgetStore()
-            imports_serialized = {}
-            if self._imports:
-                for import_name in self._imports.keys():
-                    imports_serialized[import_name] = f"<imported_trait:{import_name}>"
+            self._append_logs(['✓ Edit applied', *self._prompt_cache_logs()])
             
-            widget_entry = store.save(
-                widget_code=revised_code,
-                description=self.description,
-                data_var_name=self._widget_metadata.get('data_var_name') if self._widget_metadata else None,
-                data_shape=tuple(self._widget_metadata.get('data_shape', [0, 0])) if self._widget_metadata else (0, 0),
-                model=self._widget_metadata.get('model', 'unknown') if self._widget_metadata else 'unknown',
-                exports=self._exports,
-                imports_serialized=imports_serialized,
-                theme_name=self._theme.name if self._theme else None,
-                theme_description=self._theme.description if self._theme else None,
-                notebook_path=store.get_notebook_path(),
-            )
-            if previous_metadata and previous_metadata.get("id"):
-                widget_entry["base_widget_id"] = previous_metadata["id"]
-                for entry in store.index["widgets"]:
-                    if entry["id"] == widget_entry["id"]:
-                        entry["base_widget_id"] = previous_metadata["id"]
-                        break
+            metadata = previous_metadata or {}
+            theme = self._theme
+            # Runs on the edit worker; the kernel thread may be saving or clearing too
+            with _STORE_LOCK:
+                store = _get_widget_store()
+                widget_entry = store.save(
+                    widget_code=revised_code,
+                    description=self.description,
+                    data_var_name=metadata.get('data_var_name'),
+                    # The store copies the shape into a list itself
+                    data_shape=metadata.get('data_shape', (0, 0)),
+                    model=metadata.get('model', 'unknown'),
+                    exports=self._exports,
+                    imports_serialized=self._imports_serialized,
+                    theme_name=theme.name if theme else None,
+                    theme_description=theme.description if theme else None,
+                    notebook_path=store.get_notebook_path(),
+                    defer_index=True,
+                )
+                if previous_metadata and previous_metadata.get("id"):
+                    widget_entry["base_widget_id"] = previous_metadata["id"]
+                    indexed_entry = store.get_entry_by_id(widget_entry["id"])
+                    if indexed_entry is not None:
+                        indexed_entry["base_widget_id"] = previous_metadata["id"]
                 store._save_index()
             self._widget_metadata = widget_entry
-            self.logs = self.logs + [f"Saved: {widget_entry['slug']} v{widget_entry['version']}"]
+            self._append_logs([f"Saved: {widget_entry['slug']} v{widget_entry['version']}"])
             
         except Exception as e:
             if "cancelled" in str(e).lower():
                 self.code = old_code
                 self.status = 'ready'
-                self.logs = self.logs + ['✗ Edit cancelled']
+                self._append_logs(['✗ Edit cancelled'])
             else:
                 self.status = 'error'
-                self.logs = self.logs + [f'✘ Edit failed: {str(e)}']
+                self._append_logs([f'✘ Edit failed: {str(e)}'])
         
         self.edit_in_progress = False
         self.grab_edit_request = {}
@@ -1393,33 +1698,29 @@ class VibeWidget(anywidget.AnyWidget):
 
     def _build_grab_revision_request(self, element_desc: dict, user_prompt: str) -> str:
         """Build a revision request that identifies the element for the LLM."""
-        sibling_hint = ""
+        tag = element_desc.get('tag')
         sibling_count = element_desc.get('siblingCount', 1)
-        is_data_bound = element_desc.get('isDataBound', False)
-        
-        if is_data_bound:
-            sibling_hint = f"""
-
-IMPORTANT: This element is likely DATA-BOUND (one of {sibling_count} sibling <{element_desc.get('tag')}> elements).
-This typically means it was created by D3's .selectAll().data().join() pattern or similar.
-To modify this element, find and modify the D3 selection code that creates these elements,
-not a single static element in the template."""
+        sibling_hint = (
+            _DATA_BOUND_HINT.format(sibling_count=sibling_count, tag=tag)
+            if element_desc.get('isDataBound', False)
+            else ""
+        )
         
         style_info = ""
         style_hints = element_desc.get('styleHints', {})
         if style_hints:
-            style_parts = [f"{k}: {v}" for k, v in style_hints.items() if v and v != 'none']
-            if style_parts:
-                style_info = f"\n- Current styles: {', '.join(style_parts)}"
+            style_text = ", ".join(f"{k}: {v}" for k, v in style_hints.items() if v and v != 'none')
+            if style_text:
+                style_info = f"\n- Current styles: {style_text}"
         
         return f"""USER REQUEST: {user_prompt}
 
 TARGET ELEMENT:
-- Tag: {element_desc.get('tag')}
+- Tag: {tag}
 - Classes: {element_desc.get('classes', 'none')}
 - Text content: {element_desc.get('text', 'none')}
 - SVG/HTML attributes: {element_desc.get('attributes', 'none')}
-- Location in DOM: {element_desc.get('ancestors', '')} > {element_desc.get('tag')}
+- Location in DOM: {element_desc.get('ancestors', '')} > {tag}
 - Sibling count: {sibling_count} (same tag in parent){style_info}
 - HTML representation: {element_desc.get('description', '')}
 {sibling_hint}
@@ -1485,40 +1786,100 @@ def _serialize_inputs(widget: VibeWidget) -> dict[str, Any]:
     return {"embedded": True, "values": values}
 
 
+class _Propagator:
+    """Observer that copies source export changes onto imported traits."""
+
+    __slots__ = ("target_widget", "mapping")
+
+    def __init__(self, target_widget: VibeWidget, mapping: dict[str, list[str]]):
+        self.target_widget = target_widget
+        self.mapping = mapping
+
+    def __call__(self, change) -> None:
+        for target_trait in self.mapping[change.name]:
+            self.target_widget.set_trait(target_trait, change.new)
+
+
 def _link_imports(widget: VibeWidget, imports: dict[str, Any] | None) -> None:
     """Link imported traits to widget."""
     if not imports:
         return
     
+    # Group export imports by source widget so each source gets a single observer
+    grouped: dict[int, tuple[VibeWidget, dict[str, list[str]]]] = {}
+    exports_by_source: dict[int, dict[str, str] | None] = {}
     for import_name, import_source in imports.items():
         source_widget, source_trait = _resolve_import_source(import_name, import_source)
         if source_widget and source_trait:
-            if isinstance(source_widget, VibeWidget) and source_trait in getattr(source_widget, "_exports", {}):
+            exports = None
+            if isinstance(source_widget, VibeWidget):
+                source_key = id(source_widget)
+                if source_key in exports_by_source:
+                    exports = exports_by_source[source_key]
+                else:
+                    exports = exports_by_source[source_key] = getattr(source_widget, "_exports", None)
+            if exports is not None and source_trait in exports:
                 try:
                     initial_value = source_widget._get_export_value(source_trait)
                     setattr(widget, import_name, initial_value)
                 except AttributeError:
                     pass
 
-                def _propagate(change, target_widget=widget, target_trait=import_name):
-                    target_widget.set_trait(target_trait, change.new)
-
-                source_widget.observe(_propagate, names=source_trait)
+                _, mapping = grouped.setdefault(id(source_widget), (source_widget, {}))
+                mapping.setdefault(source_trait, []).append(import_name)
             else:
                 traitlets.link((source_widget, source_trait), (widget, import_name))
 
+    for source_widget, mapping in grouped.values():
+        source_widget.observe(_Propagator(widget, mapping), names=list(mapping))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_ipython_display() -> tuple[Any, Any] | None:
+    """Return IPython's (display, Markdown), or None when IPython is unavailable."""
+    try:
+        from IPython.display import display, Markdown
+    except ImportError:
+        return None
+    return display, Markdown
+
+
+def _show_audit_yaml(report_yaml: str) -> None:
+    """Render an audit report as Markdown in IPython, falling back to print."""
+    ipython_display = _get_ipython_display()
+    if ipython_display is not None:
+        display, markdown = ipython_display
+        try:
+            display(markdown(f"```yaml\n{report_yaml}\n```"))
+            return
+        except Exception:
+            pass
+    print(report_yaml)
+
 
 def _display_widget(widget: VibeWidget) -> None:
     """Display widget in IPython environment if available."""
+    ipython_display = _get_ipython_display()
+    if ipython_display is None:
+        return
     try:
-        from IPython.display import display
-        display(widget)
-    except ImportError:
-        pass
+        ipython_display[0](widget)
     except Exception as exc:
         print(f"[vibe_widget] Display error: {exc}", file=sys.stderr)
 
 
+_MODE_MAPS: dict[str, dict[str, str]] = {
+    "premium": PREMIUM_MODELS,
+    "standard": STANDARD_MODELS,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _map_model(mode: str, candidate: str | None) -> str | None:
+    """Map a model alias to its concrete id for the given config mode."""
+    return _MODE_MAPS.get(mode, STANDARD_MODELS).get(candidate, candidate)
+
+
 def _resolve_model(
     model_override: str | None = None,
     config_override: Config | None = None,
@@ -1533,10 +1894,7 @@ def _resolve_model(
         set_global_config(config_override)
 
     config = get_global_config()
-    candidate = model_override or config.model
-    model_map = PREMIUM_MODELS if config.mode == "premium" else STANDARD_MODELS
-    resolved_model = model_map.get(candidate, candidate)
-    return resolved_model, config
+    return _map_model(config.mode, model_override or config.model), config
 
 
 def _normalize_api_inputs(
@@ -1640,7 +1998,7 @@ def create(
         description=description,
         data_source=data,
         data_type=type(data) if data is not None else None,
-        data_columns=list(df.columns) if isinstance(df, pd.DataFrame) else None,
+        data_columns=tuple(df.columns) if isinstance(df, pd.DataFrame) else None,
         exports=outputs,
         imports=inputs,
         model=model,
@@ -1650,14 +2008,28 @@ def create(
     return widget
 
 
+_UNSET = object()
+
+
 class _SourceInfo:
     """Container for resolved source information."""
-    def __init__(self, code: str, metadata: dict[str, Any] | None, components: list[str], df: pd.DataFrame | None, theme: Theme | None):
+
+    __slots__ = ("code", "metadata", "components", "theme", "raw_data", "_df")
+
+    def __init__(self, code: str, metadata: dict[str, Any] | None, components: list[str], raw_data: list[dict[str, Any]] | None, theme: Theme | None):
         self.code = code
         self.metadata = metadata
         self.components = components
-        self.df = df
+        self.raw_data = raw_data
         self.theme = theme
+        self._df = _UNSET
+
+    @property
+    def df(self) -> pd.DataFrame | None:
+        """Source data as a DataFrame, built only when the caller needs it."""
+        if self._df is _UNSET:
+            self._df = pd.DataFrame(self.raw_data) if self.raw_data else None
+        return self._df
 
 
 def _resolve_source(
@@ -1670,7 +2042,7 @@ def _resolve_source(
             code=source.code,
             metadata=source._widget_metadata,
             components=source._widget_metadata.get("components", []) if source._widget_metadata else [],
-            df=pd.DataFrame(source.data) if source.data else None,
+            raw_data=source.data,
             theme=source._theme,
         )
     
@@ -1679,39 +2051,62 @@ def _resolve_source(
             code=source.code,
             metadata=source.metadata,
             components=[source.component_name],
-            df=pd.DataFrame(source.widget.data) if source.widget.data else None,
+            raw_data=source.widget.data,
             theme=source.widget._theme,
         )
     
     if isinstance(source, (str, Path)):
-        result = store.load_by_id(str(source)) if isinstance(source, str) else None
-        if not result and isinstance(source, str):
-            result = store.load_from_file(Path(source))
-        elif isinstance(source, Path):
-            result = store.load_from_file(source)
-        
-        if result:
-            metadata, code = result
-            theme = None
-            if metadata:
-                theme_description = metadata.get("theme_description")
-                theme_name = metadata.get("theme_name")
-                if theme_description:
-                    theme = Theme(description=theme_description, name=theme_name)
-            return _SourceInfo(
-                code=code,
-                metadata=metadata,
-                components=metadata.get("components", []),
-                df=None,
-                theme=theme,
-            )
-        
-        error_msg = f"Could not find widget with ID '{source}'" if isinstance(source, str) else f"Widget file not found: {source}"
-        raise ValueError(error_msg)
+        is_id = isinstance(source, str)
+        # IDs resolve through the store's index, which can change under us; only files are cached
+        result = store.load_by_id(source) if is_id else None
+        if result is None:
+            result = _resolve_source_by_path(store, str(source), is_id, _file_mtime_ns(Path(source)))
+        metadata, code = result
+        theme = None
+        if metadata:
+            theme_description = metadata.get("theme_description")
+            theme_name = metadata.get("theme_name")
+            if theme_description:
+                theme = Theme(description=theme_description, name=theme_name)
+        return _SourceInfo(
+            code=code,
+            metadata=metadata,
+            components=metadata.get("components", []),
+            raw_data=None,
+            theme=theme,
+        )
     
     raise TypeError(f"Invalid source type: {type(source)}")
 
 
+def _file_mtime_ns(path: Path) -> int | None:
+    """Return a file's modification time, or None when it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_source_by_path(
+    store: WidgetStore,
+    source: str,
+    is_id: bool,
+    mtime_ns: int | None,
+) -> tuple[dict[str, Any], str]:
+    """Load (metadata, code) for a widget file path.
+
+    Cached per path; ``mtime_ns`` keys the cache so edited files are re-read.
+    ``is_id`` only picks the error message for a source that was tried as an ID first.
+    Misses raise instead of returning None so they are never cached.
+    """
+    result = store.load_from_file(Path(source))
+    if not result:
+        error_msg = f"Could not find widget with ID '{source}'" if is_id else f"Widget file not found: {source}"
+        raise ValueError(error_msg)
+    return result
+
+
 def edit(
     description: str,
     source: "VibeWidget | ComponentReference | str | Path",
@@ -1746,8 +2141,8 @@ def edit(
         outputs=outputs,
         inputs=inputs,
     )
-    store = WidgetStore()
-    source_info = _resolve_source(source, store)
+    with _STORE_LOCK:
+        source_info = _resolve_source(source, _get_widget_store())
     model, resolved_config = _resolve_model(config_override=config)
     if theme is None and source_info.theme is not None:
         resolved_theme = source_info.theme
@@ -1758,7 +2153,9 @@ def edit(
             api_key=resolved_config.api_key if resolved_config else None,
             cache=cache,
         )
-    df = source_info.df if data is None and source_info.df is not None else load_data(data)
+    reuse_source_data = data is None and bool(source_info.raw_data)
+    df = source_info.df if reuse_source_data else load_data(data)
+    source_df = df if reuse_source_data else None
     
     widget = VibeWidget._create_with_dynamic_traits(
         description=description,
@@ -1779,9 +2176,9 @@ def edit(
     _link_imports(widget, inputs)
     widget._set_recipe(
         description=description,
-        data_source=data if data is not None else source_info.df,
-        data_type=type(data) if data is not None else (type(source_info.df) if source_info.df is not None else None),
-        data_columns=list(df.columns) if isinstance(df, pd.DataFrame) else None,
+        data_source=data if data is not None else source_df,
+        data_type=type(data) if data is not None else (type(source_df) if source_df is not None else None),
+        data_columns=tuple(df.columns) if isinstance(df, pd.DataFrame) else None,
         exports=outputs,
         imports=inputs,
         model=model,
@@ -1794,62 +2191,86 @@ def edit(
     return widget
 
 
+# Top-level .vw payload fields read by load(), in unpacking order
+_BUNDLE_FIELDS = (
+    "description", "code", "outputs", "inputs_signature", "theme", "components",
+    "save_inputs", "model", "version", "created_at", "audit",
+)
+
+# Read-only placeholder frame for bundles without embedded data
+_EMPTY_DF = pd.DataFrame()
+
+
 def load(path: str | Path, approval: bool = True, display: bool = True) -> VibeWidget:
     """Load a widget bundle from disk."""
     target = Path(path)
-    with open(target, "r", encoding="utf-8") as handle:
-        payload = json.load(handle)
-
-    description = payload.get("description") or "Loaded widget"
-    code = payload.get("code") or ""
-    outputs = payload.get("outputs") or {}
-    inputs_signature = payload.get("inputs_signature") or {}
-    theme_payload = payload.get("theme") or {}
-    components = payload.get("components") or []
-    save_inputs = payload.get("save_inputs") or {}
+    source_path = str(target.resolve())
+    payload = read_json_file(target)
+
+    (
+        description, code, outputs, inputs_signature, theme_payload, components,
+        save_inputs, model, version, created_at, audit,
+    ) = map(payload.get, _BUNDLE_FIELDS)
+    description = description or "Loaded widget"
+    code = code or ""
+    outputs = outputs or {}
+    inputs_signature = inputs_signature or {}
+    theme_payload = theme_payload or {}
+    components = components or []
+    save_inputs = save_inputs or {}
     embedded = bool(save_inputs.get("embedded"))
-    input_values = save_inputs.get("values") if isinstance(save_inputs.get("values"), dict) else {}
+    input_values = save_inputs.get("values")
+    if not isinstance(input_values, dict):
+        input_values = {}
+    if isinstance(theme_payload, dict):
+        theme_name = theme_payload.get("name")
+        theme_description = theme_payload.get("description")
+    else:
+        theme_name = theme_description = None
 
-    data_rows = []
-    if embedded and isinstance(input_values, dict):
-        data_rows = input_values.pop("data", [])
+    data_rows = input_values.get("data", []) if embedded else []
 
-    df = pd.DataFrame(data_rows) if isinstance(data_rows, list) else pd.DataFrame()
+    # Most bundles carry no embedded rows; share one empty frame for those
+    if data_rows and isinstance(data_rows, list):
+        df = records_to_dataframe(data_rows)
+        data_columns = tuple(df.columns)
+    else:
+        df = _EMPTY_DF
+        data_columns = ()
 
     imports: dict[str, Any] = {}
-    if isinstance(inputs_signature, dict):
-        for name in inputs_signature.keys():
-            if name == "data":
-                continue
-            imports[name] = None
-    if isinstance(input_values, dict):
-        for name, value in input_values.items():
-            if name == "data":
-                continue
-            if isinstance(value, dict) and value.get("type") == "export_handle":
+    if inputs_signature and isinstance(inputs_signature, dict):
+        for name in inputs_signature:
+            if name != "data":
                 imports[name] = None
-            else:
-                imports[name] = value
+    # Plain input values, replayed onto the widget's traits once it exists
+    trait_values: list[tuple[str, Any]] = []
+    for name, value in input_values.items():
+        if name == "data":
+            continue
+        # Parsed JSON objects are always plain dicts, so an exact type check suffices
+        if type(value) is dict and value.get("type") == "export_handle":
+            imports[name] = None
+        else:
+            imports[name] = value
+            trait_values.append((name, value))
 
     theme = None
-    if isinstance(theme_payload, dict) and (theme_payload.get("name") or theme_payload.get("description")):
-        theme = Theme(
-            description=theme_payload.get("description") or "",
-            name=theme_payload.get("name"),
-        )
+    if theme_name or theme_description:
+        theme = Theme(description=theme_description or "", name=theme_name)
 
     metadata = {
         "description": description,
         "components": components,
-        "model": payload.get("model"),
-        "theme_name": theme_payload.get("name") if isinstance(theme_payload, dict) else None,
-        "theme_description": theme_payload.get("description") if isinstance(theme_payload, dict) else None,
+        "model": model,
+        "theme_name": theme_name,
+        "theme_description": theme_description,
         "inputs_signature": inputs_signature,
         "outputs": outputs,
-        "source_path": str(target.resolve()),
-        "version": payload.get("version"),
-        "created_at": payload.get("created_at"),
-        "audit": payload.get("audit"),
+        "source_path": source_path,
+        "version": version,
+        "created_at": created_at,
+        "audit": audit,
     }
 
     execution_mode = "approve" if approval else "auto"
@@ -1859,7 +2280,7 @@ def load(path: str | Path, approval: bool = True, display: bool = True) -> VibeW
     widget = VibeWidget._create_with_dynamic_traits(
         description=description,
         df=df,
-        model=payload.get("model") or DEFAULT_MODEL,
+        model=model or DEFAULT_MODEL,
         exports=outputs,
         imports=imports,
         theme=theme,
@@ -1873,62 +2294,68 @@ def load(path: str | Path, approval: bool = True, display: bool = True) -> VibeW
         execution_approved_hash=approved_hash,
     )
 
-    if isinstance(input_values, dict):
-        for name, value in input_values.items():
-            if name == "data":
-                continue
-            if isinstance(value, dict) and value.get("type") == "export_handle":
-                continue
-            try:
-                setattr(widget, name, value)
-            except Exception:
-                pass
+    for name, value in trait_values:
+        if not widget.has_trait(name):
+            continue
+        try:
+            setattr(widget, name, value)
+        except traitlets.TraitError:
+            pass
 
     widget._set_recipe(
         description=description,
         data_source=data_rows if embedded else None,
         data_type=type(data_rows) if embedded else None,
-        data_columns=list(df.columns) if isinstance(df, pd.DataFrame) else None,
+        data_columns=data_columns,
         exports=outputs,
         imports=imports,
-        model=payload.get("model") or DEFAULT_MODEL,
+        model=model or DEFAULT_MODEL,
         theme=theme,
     )
 
     return widget
 
 
+# Cache-type names accepted by clear()
+_CLEAR_WIDGET_TARGETS = frozenset({"widget", "widgets"})
+_CLEAR_AUDIT_TARGETS = frozenset({"audit", "audits"})
+_CLEAR_THEME_TARGETS = frozenset({"theme", "themes"})
+
+
 def clear(target: Union["VibeWidget", str] = "all") -> dict[str, int]:
     """Clear cached widgets, themes, audits, or a specific widget's cache."""
-    results = {"widgets": 0, "themes": 0, "audits": 0}
-
-    if isinstance(target, VibeWidget):
-        metadata = getattr(target, "_widget_metadata", {}) or {}
-        widget_id = metadata.get("id")
-        widget_slug = metadata.get("slug")
-        results["widgets"] = WidgetStore().clear_for_widget(widget_id=widget_id, slug=widget_slug)
-        results["audits"] = AuditStore().clear_for_widget(widget_id=widget_id, widget_slug=widget_slug)
-        return results
-
-    if isinstance(target, str):
-        normalized = target.strip().lower()
-        if normalized in {"all"}:
-            results["widgets"] = WidgetStore().clear()
-            results["audits"] = AuditStore().clear()
-            results["themes"] = clear_theme_cache()
-            return results
-        if normalized in {"widget", "widgets"}:
-            results["widgets"] = WidgetStore().clear()
-            return results
-        if normalized in {"audit", "audits"}:
-            results["audits"] = AuditStore().clear()
-            return results
-        if normalized in {"theme", "themes"}:
-            results["themes"] = clear_theme_cache()
+    # Edit workers save to the widget store; keep them out while it is reset and cleared
+    with _STORE_LOCK:
+        results = {"widgets": 0, "themes": 0, "audits": 0}
+        _reset_widget_store()
+
+        if isinstance(target, VibeWidget):
+            metadata = getattr(target, "_widget_metadata", {}) or {}
+            widget_id = metadata.get("id")
+            widget_slug = metadata.get("slug")
+            results["widgets"] = _get_widget_store().clear_for_widget(widget_id=widget_id, slug=widget_slug)
+            results["audits"] = _get_audit_store().clear_for_widget(widget_id=widget_id, widget_slug=widget_slug)
             return results
 
-        results["widgets"] = WidgetStore().clear_for_widget(widget_id=target, slug=target)
-        results["audits"] = AuditStore().clear_for_widget(widget_id=target, widget_slug=target)
-        return results
+        if isinstance(target, str):
+            normalized = target.strip().lower()
+            if normalized == "all":
+                results["widgets"] = _get_widget_store().clear()
+                results["audits"] = _get_audit_store().clear()
+                results["themes"] = clear_theme_cache()
+                return results
+            if normalized in _CLEAR_WIDGET_TARGETS:
+                results["widgets"] = _get_widget_store().clear()
+                return results
+            if normalized in _CLEAR_AUDIT_TARGETS:
+                results["audits"] = _get_audit_store().clear()
+                return results
+            if normalized in _CLEAR_THEME_TARGETS:
+                results["themes"] = clear_theme_cache()
+                return results
+
+            results["widgets"] = _get_widget_store().clear_for_widget(widget_id=target, slug=target)
+            results["audits"] = _get_audit_store().clear_for_widget(widget_id=target, widget_slug=target)
+            return results
 
-    raise TypeError("vw.clear expects a cache type string or a VibeWidget instance.")
+        raise TypeError("vw.clear expects a cache type string or a VibeWidget instance.")
@@ -1,4 +1,7 @@
+from collections import OrderedDict
 from typing import Any, Callable, Tuple
+import hashlib
+import json
 
 import pandas as pd
 
@@ -9,6 +12,9 @@ from vibe_widget.llm.tools.data_tools import DataLoadTool, DataProfileTool, Data
 from vibe_widget.llm.tools.code_tools import CodeValidateTool
 from vibe_widget.llm.tools.execution_tools import RuntimeTestTool, ErrorDiagnoseTool
 
+# Revise/fix results kept per orchestrator for repeated identical requests
+RESPONSE_CACHE_SIZE = 32
+
 
 class AgenticOrchestrator:
     """
@@ -26,9 +32,11 @@ class AgenticOrchestrator:
         self,
         provider: LLMProvider,
         max_repair_attempts: int = 3,
+        cache_responses: bool = True,
     ):
         self.provider = provider
         self.max_repair_attempts = max_repair_attempts
+        self.cache_responses = cache_responses
 
         # Tool instances
         self.data_load_tool = DataLoadTool()
@@ -40,6 +48,9 @@ class AgenticOrchestrator:
 
         # For storing artifacts if needed
         self.artifacts = {}
+        self._response_cache: OrderedDict[str, str] = OrderedDict()
+        # Whether the last revise/fix result came from _response_cache
+        self.last_response_cached = False
     
     def generate(
         self,
@@ -168,6 +179,7 @@ class AgenticOrchestrator:
         error_message: str,
         data_info: dict[str, Any],
         progress_callback: Callable[[str, str], None] | None = None,
+        use_cache: bool = True,
     ) -> str:
         """
         Fix a runtime error in widget code.
@@ -177,10 +189,21 @@ class AgenticOrchestrator:
             error_message: Error message from runtime
             data_info: Data context information
             progress_callback: Optional progress callback
+            use_cache: Reuse a stored fix for the same code and error
         
         Returns:
             Fixed widget code
         """
+        # code failed at runtime, so no stored result that produced it is reusable
+        self._discard_response(code)
+        cache_key = None
+        if self.cache_responses:
+            cache_key = self._cache_key("fix", code, error_message, data_info)
+        cached = self._cached_response(cache_key, use_cache)
+        if cached is not None:
+            self._emit(progress_callback, "step", "Reusing previous fix")
+            return cached
+
         self._emit(progress_callback, "step", "Diagnosing error...")
         
         diagnosis = self.diagnose_tool.execute(
@@ -196,6 +219,7 @@ class AgenticOrchestrator:
             data_info=data_info,
         )
         
+        self._store_response(cache_key, fixed_code)
         return fixed_code
     
     def revise_code(
@@ -204,6 +228,7 @@ class AgenticOrchestrator:
         revision_request: str,
         data_info: dict[str, Any],
         progress_callback: Callable[[str, str], None] | None = None,
+        use_cache: bool = True,
     ) -> str:
         """
         Revise widget code based on user request.
@@ -213,10 +238,19 @@ class AgenticOrchestrator:
             revision_request: User's revision request
             data_info: Data context information
             progress_callback: Optional progress callback
+            use_cache: Reuse a stored revision for the same code and request
         
         Returns:
             Revised widget code
         """
+        cache_key = None
+        if self.cache_responses:
+            cache_key = self._cache_key("revise", code, revision_request, data_info)
+        cached = self._cached_response(cache_key, use_cache)
+        if cached is not None:
+            self._emit(progress_callback, "complete", "Reused previous revision")
+            return cached
+
         self._emit(progress_callback, "step", "Revising widget code...")
         
         revised_code = self.provider.revise_widget_code(
@@ -236,7 +270,42 @@ class AgenticOrchestrator:
             revised_code = self._repair_with_issues(revised_code, issues, data_info)
         
         self._emit(progress_callback, "complete", "Revision complete")
+        self._store_response(cache_key, revised_code)
         return revised_code
+
+    def _cache_key(self, kind: str, code: str, request: str, data_info: dict[str, Any]) -> str:
+        """Hash everything that determines a revise/fix result."""
+        digest = hashlib.blake2b(digest_size=16)
+        model = getattr(self.provider, "model", "")
+        # No sort_keys: sample rows can mix int and str column labels, which don't
+        # compare. data_info is built in a fixed order, so insertion order is stable.
+        schema = json.dumps(data_info, default=str)
+        for part in (kind, model, code, request, schema):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _cached_response(self, key: str | None, use_cache: bool) -> str | None:
+        cached = self._response_cache.get(key) if use_cache and key is not None else None
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+        self.last_response_cached = cached is not None
+        return cached
+
+    def _store_response(self, key: str | None, code: str) -> None:
+        if key is None:
+            return
+        cache = self._response_cache
+        cache[key] = code
+        cache.move_to_end(key)
+        if len(cache) > RESPONSE_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _discard_response(self, code: str) -> None:
+        """Forget stored results that produced code."""
+        cache = self._response_cache
+        for key in [key for key, value in cache.items() if value == code]:
+            del cache[key]
     
     def _repair_with_issues(
         self,
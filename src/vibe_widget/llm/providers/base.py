@@ -231,7 +231,28 @@ Begin the response with code immediately."""
         base_code: str | None = None,
         base_components: list[str] | None = None,
     ) -> str:
-        """Build the prompt for code revision.
+        """Build the prompt for code revision."""
+        instructions, body = self._build_revision_prompt_parts(
+            current_code,
+            revision_description,
+            data_info,
+            base_code=base_code,
+            base_components=base_components,
+        )
+        return instructions + body
+
+    def _build_revision_prompt_parts(
+        self,
+        current_code: str,
+        revision_description: str,
+        data_info: dict[str, Any],
+        base_code: str | None = None,
+        base_components: list[str] | None = None,
+    ) -> tuple[str, str]:
+        """Build the revision prompt as a (static instructions, per-request body) pair.
+
+        The instructions are identical for every revision, so provider prompt
+        caches can reuse them; the code changes after each edit and goes in the body.
         
         Args:
             current_code: Current widget code
@@ -258,11 +279,21 @@ Begin the response with code immediately."""
         if theme_description:
             theme_section = f"THEME:\n{theme_description}\n\n"
 
-        return f"""Revise the following AnyWidget React bundle code according to the request.
+        prefix = f"""Revise the following AnyWidget React bundle code according to the request at the end.
+
+Follow the SAME constraints as generation:
+- export default function Widget({{ model, html, React }})
+- html tagged templates only (no JSX)
+- ESM CDN imports with locked versions
+- Thorough cleanup in every React.useEffect
+- Export reusable components as named exports when appropriate
+
+Focus on making ONLY the requested changes. Reuse existing code structure where possible.
 
-REVISION REQUEST: {revision_description}
+Return only the full revised JavaScript code. No markdown fences or explanations.
 
-CURRENT CODE:
+"""
+        body = f"""CURRENT CODE:
 ```javascript
 {current_code}
 ```
@@ -274,16 +305,8 @@ CURRENT CODE:
 
 {exports_imports_section}
 
-Follow the SAME constraints as generation:
-- export default function Widget({{ model, html, React }})
-- html tagged templates only (no JSX)
-- ESM CDN imports with locked versions
-- Thorough cleanup in every React.useEffect
-- Export reusable components as named exports when appropriate
-
-Focus on making ONLY the requested changes. Reuse existing code structure where possible.
-
-Return only the full revised JavaScript code. No markdown fences or explanations."""
+REVISION REQUEST: {revision_description}"""
+        return prefix, body
     
     def _build_fix_prompt(
         self,
@@ -292,6 +315,16 @@ Return only the full revised JavaScript code. No markdown fences or explanations
         data_info: dict[str, Any],
     ) -> str:
         """Build the prompt for fixing code errors."""
+        instructions, body = self._build_fix_prompt_parts(broken_code, error_message, data_info)
+        return instructions + body
+
+    def _build_fix_prompt_parts(
+        self,
+        broken_code: str,
+        error_message: str,
+        data_info: dict[str, Any],
+    ) -> tuple[str, str]:
+        """Build the fix prompt as a (static instructions, code and error body) pair."""
         columns = data_info.get("columns", [])
         dtypes = data_info.get("dtypes", {})
         sample_data = data_info.get("sample", {})
@@ -305,14 +338,22 @@ Return only the full revised JavaScript code. No markdown fences or explanations
         if theme_description:
             theme_section = f"THEME:\n{theme_description}\n\n"
 
-        return f"""Fix the AnyWidget React bundle code below. Keep the interaction model identical while eliminating the runtime error.
+        prefix = f"""Fix the AnyWidget React bundle code below. Keep the interaction model identical while eliminating the runtime error reported at the end.
 Preserve all user-intended changes and visual styling; make the smallest possible fix.
 Do NOT remove, rename, or rewrite unrelated parts of the code.
 
-ERROR MESSAGE:
-{error_message}
+MANDATORY FIX RULES:
+1. Export default function Widget({{ model, html, React }})
+2. Use html tagged templates (htm) instead of JSX
+3. Guard every model.get payload before iterating
+4. Keep CDN imports version-pinned
+5. Restore all cleanup handlers
+6. Initialize exports and call model.save_changes()
 
-BROKEN CODE:
+Return ONLY the corrected JavaScript code.
+
+"""
+        body = f"""BROKEN CODE:
 ```javascript
 {broken_code}
 ```
@@ -324,15 +365,9 @@ Data schema:
 
 {theme_section}{exports_imports_section}
 
-MANDATORY FIX RULES:
-1. Export default function Widget({{ model, html, React }})
-2. Use html tagged templates (htm) instead of JSX
-3. Guard every model.get payload before iterating
-4. Keep CDN imports version-pinned
-5. Restore all cleanup handlers
-6. Initialize exports and call model.save_changes()
-
-Return ONLY the corrected JavaScript code."""
+ERROR MESSAGE:
+{error_message}"""
+        return prefix, body
 
     def _build_audit_prompt(
         self,
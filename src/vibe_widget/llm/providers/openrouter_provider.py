@@ -29,6 +29,7 @@ class OpenRouterProvider(LLMProvider):
             app_title: Optional X-Title header for OpenRouter analytics
         """
         self.model = model
+        self.last_cached_tokens = 0
 
         api_key = api_key or os.environ.get("OPENROUTER_API_KEY")
         if not api_key:
@@ -86,27 +87,30 @@ class OpenRouterProvider(LLMProvider):
         progress_callback: Callable[[str], None] | None = None,
     ) -> str:
         """Revise existing widget code."""
-        prompt = self._build_revision_prompt(
+        instructions, body = self._build_revision_prompt_parts(
             current_code,
             revision_description,
             data_info,
             base_code=base_code,
             base_components=base_components,
         )
+        self.last_cached_tokens = 0
         
         completion_params = {
             "model": self.model,
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": self._prompt_messages(instructions, body),
             "max_tokens": MAX_TOKENS,
             "temperature": 0.7,
         }
 
         if progress_callback:
             completion_params["stream"] = True
+            completion_params["stream_options"] = {"include_usage": True}
             stream = self.client.chat.completions.create(**completion_params)
             return self._handle_stream(stream, progress_callback)
 
         response = self.client.chat.completions.create(**completion_params)
+        self._record_usage(response.usage)
         return self.clean_code(response.choices[0].message.content)
 
     def fix_code_error(
@@ -116,13 +120,15 @@ class OpenRouterProvider(LLMProvider):
         data_info: dict[str, Any],
     ) -> str:
         """Fix errors in widget code."""
-        prompt = self._build_fix_prompt(broken_code, error_message, data_info)
+        instructions, body = self._build_fix_prompt_parts(broken_code, error_message, data_info)
+        self.last_cached_tokens = 0
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=[{"role": "user", "content": prompt}],
+            messages=self._prompt_messages(instructions, body),
             max_tokens=MAX_TOKENS,
             temperature=0.3,
         )
+        self._record_usage(response.usage)
         return self.clean_code(response.choices[0].message.content)
 
     def generate_audit_report(
@@ -170,12 +176,38 @@ class OpenRouterProvider(LLMProvider):
         response = self.client.chat.completions.create(**completion_params)
         return (response.choices[0].message.content or "").strip()
 
+    def _prompt_messages(self, instructions: str, body: str) -> list[dict[str, Any]]:
+        """Build the user message with the static instructions first.
+
+        OpenAI-style backends cache long identical prefixes automatically;
+        Anthropic models need an explicit cache_control breakpoint. Only the
+        instructions are marked, since the code in the body changes every edit
+        and each cache write costs more than an uncached read.
+        """
+        if self.model.startswith("anthropic/"):
+            content = [
+                {"type": "text", "text": instructions, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": body},
+            ]
+            return [{"role": "user", "content": content}]
+        return [{"role": "user", "content": instructions + body}]
+
+    def _record_usage(self, usage: Any) -> None:
+        """Remember how many prompt tokens were served from the provider cache."""
+        details = getattr(usage, "prompt_tokens_details", None)
+        self.last_cached_tokens = getattr(details, "cached_tokens", None) or 0
+
     def _handle_stream(self, stream, progress_callback: Callable[[str], None]) -> str:
         """Handle streaming response."""
         code_chunks = []
         for chunk in stream:
-            if chunk.choices[0].delta.content:
-                text = chunk.choices[0].delta.content
+            usage = getattr(chunk, "usage", None)
+            if usage is not None:
+                self._record_usage(usage)
+            if not chunk.choices:
+                continue
+            text = chunk.choices[0].delta.content
+            if text:
                 code_chunks.append(text)
                 progress_callback(text)
 
@@ -126,6 +126,8 @@ class AuditStore:
 
         self.audits_dir.mkdir(parents=True, exist_ok=True)
         self.index_dir.mkdir(parents=True, exist_ok=True)
+        # Taken before reading, so a rewrite during the read is picked up next time
+        self._index_stat = self._index_signature()
         self.index = self._load_index()
 
     def _load_index(self) -> dict[str, Any]:
@@ -140,6 +142,23 @@ class AuditStore:
     def _save_index(self) -> None:
         with open(self.index_file, "w", encoding="utf-8") as handle:
             json.dump(self.index, handle, indent=2, ensure_ascii=True)
+        self._index_stat = self._index_signature()
+
+    def _index_signature(self) -> tuple[int, int] | None:
+        """Return the index file's (mtime_ns, size), or None when it does not exist."""
+        try:
+            stat = self.index_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def refresh_index(self) -> None:
+        """Reload the index if another kernel or process has rewritten it."""
+        signature = self._index_signature()
+        if signature == self._index_stat:
+            return
+        self._index_stat = signature
+        self.index = self._load_index()
 
     def clear(self) -> int:
         """Remove all cached audits and reset the index."""
@@ -226,6 +245,8 @@ class AuditStore:
         widget_slug = widget_metadata.get("slug") or "widget"
         widget_version = widget_metadata.get("version")
 
+        # Versions must account for audits other processes saved since the last read
+        self.refresh_index()
         existing_versions = [
             entry["version"]
             for entry in self.index["audits"]
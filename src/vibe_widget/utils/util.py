@@ -4,12 +4,20 @@ Helper functions for data cleaning, serialization, and trait management.
 """
 from pathlib import Path
 from typing import Any
+import json
+import mmap
 import pandas as pd
 import numpy as np
+
 from vibe_widget.llm.tools.data_tools import DataLoadTool
 from vibe_widget.api import ExportHandle
 from vibe_widget.config import Config, get_global_config
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
 
 def clean_for_json(obj: Any) -> Any:
     """
@@ -49,6 +57,185 @@ def clean_for_json(obj: Any) -> Any:
         return obj if isinstance(obj, (str, int, float, bool, type(None))) else str(obj)
 
 
+def df_needs_cleaning(df: pd.DataFrame) -> bool:
+    """
+    Check whether records built from a DataFrame may need clean_for_json.
+    
+    Plain numpy int/uint/bool columns, finite float columns, and object
+    columns holding only strings already produce JSON-safe records.
+    
+    Args:
+        df: DataFrame about to be converted with to_dict(orient="records")
+        
+    Returns:
+        False when the cleaning pass can be skipped
+    """
+    for _, column in df.items():
+        dtype = column.dtype
+        if not isinstance(dtype, np.dtype):
+            # Extension dtypes (nullable ints, categoricals, ...) can hold pd.NA
+            return True
+        kind = dtype.kind
+        if kind in "iub":
+            continue
+        if kind == "f":
+            if np.isfinite(column.to_numpy()).all():
+                continue
+            return True
+        if kind == "O" and pd.api.types.infer_dtype(column, skipna=False) == "string":
+            continue
+        return True
+    return False
+
+
+def loads_json(data: str | bytes) -> Any:
+    """
+    Parse a JSON document, using orjson when installed.
+    
+    Both backends raise json.JSONDecodeError (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Files at least this large are parsed from a memory map instead of a bytes copy
+MMAP_JSON_MIN_BYTES = 64 * 1024
+
+
+def read_json_file(path: Path, size: int | None = None) -> Any:
+    """
+    Parse a JSON file from disk without a text-mode decode.
+    
+    With orjson installed, large files are parsed straight from a read-only
+    memory map, skipping the intermediate bytes copy of the whole file.
+    
+    Args:
+        path: File to read
+        size: File size in bytes, if the caller already has it from stat()
+        
+    Returns:
+        Parsed JSON document
+    """
+    if size is None:
+        size = path.stat().st_size
+    if orjson is None or size < MMAP_JSON_MIN_BYTES:
+        return loads_json(path.read_bytes())
+    with open(path, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
+
+
+def dumps_json(obj: Any, *, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes, using orjson when installed.
+    
+    Numpy values are written as their Python values; anything else the
+    encoder cannot handle is written as its string form.
+    
+    Args:
+        obj: JSON-compatible object
+        indent: Pretty-print with two-space indentation
+        
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_json_default, option=option)
+    return json.dumps(
+        obj, indent=2 if indent else None, ensure_ascii=False, default=_json_default
+    ).encode("utf-8")
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback encoder for values outside the JSON types."""
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    return str(value)
+
+
+def _json_safe_column(column: pd.Series) -> list[Any]:
+    """Return a column's values as JSON-safe Python objects (same output as clean_for_json)."""
+    dtype = column.dtype
+    if isinstance(dtype, np.dtype):
+        kind = dtype.kind
+        if kind in "iub":
+            return column.tolist()
+        if kind == "f":
+            array = column.to_numpy()
+            finite = np.isfinite(array)
+            if finite.all():
+                return array.tolist()
+            cleaned = array.astype(object)
+            cleaned[~finite] = None
+            return cleaned.tolist()
+        if kind == "O" and pd.api.types.infer_dtype(column, skipna=False) == "string":
+            return column.tolist()
+    return [clean_for_json(_box_native(value)) for value in column.tolist()]
+
+
+def _box_native(value: Any) -> Any:
+    """Unbox numpy scalars the way DataFrame.to_dict does for object columns."""
+    if not isinstance(value, np.generic):
+        return value
+    if isinstance(value, np.datetime64):
+        return pd.Timestamp(value)
+    if isinstance(value, np.timedelta64):
+        return pd.Timedelta(value)
+    return value.item()
+
+
+def dataframe_to_records(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """
+    Convert a DataFrame to JSON-safe records for the widget data trait.
+    
+    Clean frames go straight through to_dict. Frames that need cleaning are
+    sanitized column by column, so only columns that can hold NaN/NaT/objects
+    pay a per-value pass.
+    
+    Args:
+        df: DataFrame to convert
+        
+    Returns:
+        List of row dicts
+    """
+    if not df_needs_cleaning(df):
+        return df.to_dict(orient="records")
+    columns = list(df.columns)
+    values = [_json_safe_column(column) for _, column in df.items()]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+def records_to_dataframe(rows: list[Any]) -> pd.DataFrame:
+    """
+    Build a DataFrame from row records, going column-wise when rows share keys.
+    
+    Uniform records (the shape dataframe_to_records produces) are transposed
+    into one list per column, which pandas ingests without scanning every row
+    dict. Ragged or non-dict rows fall back to the row-oriented constructor.
+    
+    Args:
+        rows: List of row dicts
+        
+    Returns:
+        DataFrame with the same columns and values as pd.DataFrame(rows)
+    """
+    if not rows or not isinstance(rows[0], dict):
+        return pd.DataFrame(rows)
+    keys = rows[0].keys()
+    for row in rows:
+        if not isinstance(row, dict) or row.keys() != keys:
+            return pd.DataFrame(rows)
+    return pd.DataFrame({key: [row[key] for row in rows] for key in keys})
+
+
 def initial_import_value(import_name: str, import_source: Any) -> Any:
     """
     Extract the initial value from an import source (widget trait or direct value).
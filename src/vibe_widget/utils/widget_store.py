@@ -33,7 +33,11 @@ class WidgetStore:
         self.widgets_dir.mkdir(parents=True, exist_ok=True)
         self.index_dir.mkdir(parents=True, exist_ok=True)
         
+        # Taken before reading, so a rewrite during the read is picked up next time
+        self._index_stat = self._index_signature()
         self.index = self._load_index()
+        self._widgets_by_id: dict[str, dict[str, Any]] | None = None
+        self._widgets_by_hash: dict[str, list[dict[str, Any]]] | None = None
     
     def _load_index(self) -> dict[str, Any]:
         """Load the widget index from disk."""
@@ -50,6 +54,47 @@ class WidgetStore:
         """Save the widget index to disk."""
         with open(self.index_file, 'w', encoding='utf-8') as f:
             json.dump(self.index, f, indent=2, ensure_ascii=False)
+        self._index_stat = self._index_signature()
+
+    def _index_signature(self) -> tuple[int, int] | None:
+        """Return the index file's (mtime_ns, size), or None when it does not exist."""
+        try:
+            stat = self.index_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def refresh_index(self) -> None:
+        """Reload the index if another kernel or process has rewritten it."""
+        signature = self._index_signature()
+        if signature == self._index_stat:
+            return
+        self._index_stat = signature
+        self.index = self._load_index()
+        self._widgets_by_id = None
+        self._widgets_by_hash = None
+
+    def _id_map(self) -> dict[str, dict[str, Any]]:
+        """Map widget ID to its index entry, built on first use."""
+        if self._widgets_by_id is None:
+            by_id: dict[str, dict[str, Any]] = {}
+            for entry in self.index["widgets"]:
+                by_id.setdefault(entry["id"], entry)
+            self._widgets_by_id = by_id
+        return self._widgets_by_id
+
+    def _hash_map(self) -> dict[str, list[dict[str, Any]]]:
+        """Map cache-key hash to its index entries, built on first use."""
+        if self._widgets_by_hash is None:
+            by_hash: dict[str, list[dict[str, Any]]] = {}
+            for entry in self.index["widgets"]:
+                by_hash.setdefault(entry.get("hash"), []).append(entry)
+            self._widgets_by_hash = by_hash
+        return self._widgets_by_hash
+
+    def get_entry_by_id(self, widget_id: str) -> dict[str, Any] | None:
+        """Return the index entry for a widget ID, if present."""
+        return self._id_map().get(widget_id)
 
     def clear(self) -> int:
         """Remove all cached widgets and reset the index."""
@@ -63,6 +108,8 @@ class WidgetStore:
                 widget_file.unlink()
                 removed += 1
         self.index = {"schema_version": 1, "widgets": []}
+        self._widgets_by_id = None
+        self._widgets_by_hash = None
         self._save_index()
         return removed
 
@@ -89,6 +136,8 @@ class WidgetStore:
                 remaining.append(entry)
         if removed:
             self.index["widgets"] = remaining
+            self._widgets_by_id = None
+            self._widgets_by_hash = None
             self._save_index()
         return removed
     
@@ -206,16 +255,12 @@ class WidgetStore:
             theme_signature=theme_signature,
         )
         
-        matching_entries = [
-            entry for entry in self.index["widgets"]
-            if entry.get("hash") == full_hash
-        ]
-        
+        matching_entries = self._hash_map().get(full_hash)
         if not matching_entries:
             return None
         
         # Prefer the highest version for this cache key (latest saved)
-        matching_entries.sort(key=lambda e: e.get("version", 0), reverse=True)
+        matching_entries = sorted(matching_entries, key=lambda e: e.get("version", 0), reverse=True)
         
         for widget_entry in matching_entries:
             widget_file = self.widgets_dir / widget_entry["file_name"]
@@ -238,6 +283,7 @@ class WidgetStore:
         theme_name: str | None = None,
         theme_description: str | None = None,
         notebook_path: str | None = None,
+        defer_index: bool = False,
     ) -> dict[str, Any]:
         """
         Save a newly generated widget to the store.
@@ -251,6 +297,8 @@ class WidgetStore:
             exports: Export trait definitions
             imports_serialized: Import trait values
             notebook_path: Path to notebook (stored for reference, not in cache key)
+            defer_index: Skip writing the index; caller must call _save_index() after
+                further edits to the entry
         
         Returns:
             Widget metadata dict
@@ -270,6 +318,8 @@ class WidgetStore:
         
         slug = self._generate_slug(description, data_var_name)
         
+        # Versions must account for widgets other processes saved since the last read
+        self.refresh_index()
         existing_versions = [
             entry["version"]
             for entry in self.index["widgets"]
@@ -314,7 +364,12 @@ class WidgetStore:
         }
         
         self.index["widgets"].append(widget_entry)
-        self._save_index()
+        if self._widgets_by_id is not None:
+            self._widgets_by_id.setdefault(widget_id, widget_entry)
+        if self._widgets_by_hash is not None:
+            self._widgets_by_hash.setdefault(full_hash, []).append(widget_entry)
+        if not defer_index:
+            self._save_index()
         
         return widget_entry
     
@@ -333,12 +388,12 @@ class WidgetStore:
         Returns:
             Tuple of (widget_entry, code) if found, None otherwise
         """
-        for widget_entry in self.index["widgets"]:
-            if widget_entry["id"] == widget_id:
-                widget_file = self.widgets_dir / widget_entry["file_name"]
-                if widget_file.exists():
-                    code = widget_file.read_text(encoding='utf-8')
-                    return widget_entry, code
+        widget_entry = self.get_entry_by_id(widget_id)
+        if widget_entry is not None:
+            widget_file = self.widgets_dir / widget_entry["file_name"]
+            if widget_file.exists():
+                code = widget_file.read_text(encoding='utf-8')
+                return widget_entry, code
         return None
     
     def load_from_file(self, file_path: Path | str) -> tuple[dict[str, Any], str] | None:
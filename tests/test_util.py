@@ -0,0 +1,32 @@
+"""Tests for vibe_widget.utils.util."""
+import json
+
+import numpy as np
+import pandas as pd
+
+from vibe_widget.utils import util
+from vibe_widget.utils.util import clean_for_json, dataframe_to_records, dumps_json
+
+
+def test_dataframe_to_records_mixed_object_column_matches_to_dict():
+    df = pd.DataFrame({
+        "a": pd.Series([np.float64(1.5), "x", np.int64(2), np.nan], dtype=object),
+        "b": [1.0, np.nan, 3.0, np.inf],
+        "c": pd.date_range("2024-01-01", periods=4),
+    })
+
+    records = dataframe_to_records(df)
+
+    assert records == clean_for_json(df.to_dict(orient="records"))
+    assert [row["a"] for row in records] == [1.5, "x", 2, None]
+    assert type(records[0]["a"]) is float
+    assert type(records[2]["a"]) is int
+
+
+def test_dumps_json_numpy_values_and_non_string_keys(monkeypatch):
+    payload = {"threshold": np.float64(0.5), "count": np.int64(3), 1: np.array([1, 2])}
+    expected = {"threshold": 0.5, "count": 3, "1": [1, 2]}
+
+    assert json.loads(dumps_json(payload, indent=True)) == expected
+    monkeypatch.setattr(util, "orjson", None)
+    assert json.loads(dumps_json(payload, indent=True)) == expected